@@ -81,7 +81,12 @@ class TokenBucket:
 
 
 class RateLimiter:
-    """In-memory rate limiter using token bucket algorithm."""
+    """In-memory rate limiter using token bucket algorithm.
+
+    Bucket state is plain floats updated without any locking. The limiter is
+    only ever called from the event loop thread (middleware and WebSocket
+    handlers), so checks never contend and no synchronization is needed.
+    """
 
     def __init__(self, config: RateLimitConfig | None = None) -> None:
         """Initialize the rate limiter.
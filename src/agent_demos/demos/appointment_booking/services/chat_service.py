@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
+import orjson
+
+from agent_demos.demos.appointment_booking.services.conversation import (
+    CHANGE_INDICATORS,
+    message_text,
+)
+
 if TYPE_CHECKING:
     from agent_demos.demos.appointment_booking.services.notification import (
         NotificationService,
@@ -12,9 +19,35 @@ if TYPE_CHECKING:
     from agent_demos.scheduling.agent import SchedulingAgent
 
 
+@lru_cache(maxsize=512)
+def _tool_result_succeeded(content: str) -> bool:
+    """Check whether a tool_result payload reports success.
+
+    Cached because every turn rescans the whole history, so earlier tool
+    results would otherwise be parsed again on each new message.
+
+    Args:
+        content: The tool_result content string.
+
+    Returns:
+        True if the content is a JSON object with a truthy "success" field.
+    """
+    # Most tool results (availability, listings) carry no success key at all
+    if '"success"' not in content:
+        return False
+
+    try:
+        result_data = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return False
+    return isinstance(result_data, dict) and bool(result_data.get("success"))
+
+
 class ChatService:
     """Service for handling chat conversations with scheduling capabilities."""
 
+    __slots__ = ("_agent", "_notifications", "_sessions")
+
     def __init__(
         self,
         scheduling_agent: SchedulingAgent,
@@ -46,22 +79,9 @@ class ChatService:
         Returns:
             True if appointments were modified.
         """
-        change_indicators = [
-            "booked successfully",
-            "has been canceled",
-            "appointment created",
-            "appointment cancelled",
-            "scheduled for",
-            "I've booked",
-            "I've scheduled",
-            "I've canceled",
-            "I've cancelled",
-        ]
-
         response_lower = response.lower()
-        for indicator in change_indicators:
-            if indicator in response_lower:
-                return True
+        if any(indicator in response_lower for indicator in CHANGE_INDICATORS):
+            return True
 
         # Also check tool results in history for direct confirmation
         for msg in history:
@@ -71,13 +91,10 @@ class ChatService:
                     for block in content:
                         if isinstance(block, dict) and block.get("type") == "tool_result":
                             result_content = block.get("content", "")
-                            if isinstance(result_content, str):
-                                try:
-                                    result_data = json.loads(result_content)
-                                    if result_data.get("success"):
-                                        return True
-                                except (json.JSONDecodeError, TypeError):
-                                    pass
+                            if not isinstance(result_content, str):
+                                continue
+                            if _tool_result_succeeded(result_content):
+                                return True
 
         return False
 
@@ -149,24 +166,8 @@ class ChatService:
         Returns:
             List of simplified messages with role and content.
         """
-        history = self._sessions.get(session_id, [])
-        formatted: list[dict[str, str]] = []
-
-        for msg in history:
-            role = msg.get("role", "")
-            content = msg.get("content", "")
-
-            # Handle simple string content
-            if isinstance(content, str) and content.strip():
-                formatted.append({"role": role, "content": content})
-            # Handle structured content (extract text blocks)
-            elif isinstance(content, list):
-                text_parts = []
-                for block in content:
-                    if isinstance(block, dict):
-                        if block.get("type") == "text":
-                            text_parts.append(block.get("text", ""))
-                if text_parts:
-                    formatted.append({"role": role, "content": " ".join(text_parts)})
-
-        return formatted
+        return [
+            {"role": msg.get("role", ""), "content": text}
+            for msg in self._sessions.get(session_id, ())
+            if (text := message_text(msg.get("content", ""))).strip()
+        ]
@@ -0,0 +1,40 @@
+"""Conversation helpers shared by the chat and voice services."""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Phrases in a response that indicate an appointment change, already
+# lowercased so they can be matched against the lowercased response
+CHANGE_INDICATORS = (
+    "booked successfully",
+    "has been canceled",
+    "appointment created",
+    "appointment cancelled",
+    "scheduled for",
+    "i've booked",
+    "i've scheduled",
+    "i've canceled",
+    "i've cancelled",
+)
+
+
+def message_text(content: Any) -> str:
+    """Get the displayable text of a message's content.
+
+    Args:
+        content: A plain string, or a list of content blocks.
+
+    Returns:
+        The string itself, the text blocks joined by spaces, or an empty
+        string for any other content.
+    """
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return " ".join(
+            block.get("text", "")
+            for block in content
+            if isinstance(block, dict) and block.get("type") == "text"
+        )
+    return ""
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
-
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, ClassVar, get_args
+
+from agent_demos.core.exceptions import AudioProcessingError
+from agent_demos.demos.appointment_booking.services.conversation import (
+    CHANGE_INDICATORS,
+    message_text,
+)
 from agent_demos.voice.tts import Voice
 from agent_demos.voice.web_adapter import WebSTT, WebTTS
 
@@ -13,6 +19,9 @@ if TYPE_CHECKING:
     )
     from agent_demos.scheduling.agent import SchedulingAgent
 
+# Voice names in the order they are advertised to clients
+_VOICE_NAMES: tuple[Voice, ...] = get_args(Voice)
+
 
 class VoiceService:
     """Service for handling voice conversations with scheduling capabilities.
@@ -21,6 +30,10 @@ class VoiceService:
     """
 
     DEFAULT_VOICE: Voice = "nova"
+    AVAILABLE_VOICES: ClassVar[frozenset[str]] = frozenset(_VOICE_NAMES)
+
+    # Least recently used sessions are dropped once this many are stored
+    MAX_SESSIONS = 1024
 
     def __init__(
         self,
@@ -41,7 +54,7 @@ class VoiceService:
         self._notifications = notification_service
         self._stt = WebSTT(api_key=openai_api_key)
         self._tts = WebTTS(api_key=openai_api_key, voice=voice or self.DEFAULT_VOICE)
-        self._sessions: dict[str, list[dict[str, Any]]] = {}
+        self._sessions: OrderedDict[str, list[dict[str, Any]]] = OrderedDict()
 
     async def process_voice(
         self,
@@ -116,7 +129,15 @@ class VoiceService:
 
         Returns:
             Tuple of (base64-encoded audio, MIME type).
+
+        Raises:
+            AudioProcessingError: If the voice is not one of AVAILABLE_VOICES.
         """
+        if voice is not None and not self.is_available_voice(voice):
+            raise AudioProcessingError(
+                message=f"Unknown voice: {voice}",
+                stage="validation",
+            )
         return await self._tts.synthesize_base64_async(text, voice=voice)
 
     async def _process_text(
@@ -142,8 +163,11 @@ class VoiceService:
             history=history,
         )
 
-        # Store updated history
+        # Store updated history as the most recently used session
         self._sessions[session_id] = updated_history
+        self._sessions.move_to_end(session_id)
+        if len(self._sessions) > self.MAX_SESSIONS:
+            self._sessions.popitem(last=False)
 
         # Check if appointments were modified
         appointments_changed = self._detect_appointment_changes(response)
@@ -166,20 +190,8 @@ class VoiceService:
         Returns:
             True if appointments were likely modified.
         """
-        change_indicators = [
-            "booked successfully",
-            "has been canceled",
-            "appointment created",
-            "appointment cancelled",
-            "scheduled for",
-            "I've booked",
-            "I've scheduled",
-            "I've canceled",
-            "I've cancelled",
-        ]
-
         response_lower = response.lower()
-        return any(indicator in response_lower for indicator in change_indicators)
+        return any(indicator in response_lower for indicator in CHANGE_INDICATORS)
 
     def get_history(self, session_id: str) -> list[dict[str, Any]]:
         """Get conversation history for a session.
@@ -209,26 +221,25 @@ class VoiceService:
         Returns:
             List of simplified messages with role and content.
         """
-        history = self._sessions.get(session_id, [])
-        formatted: list[dict[str, str]] = []
+        return [
+            {"role": msg.get("role", ""), "content": text}
+            for msg in self._sessions.get(session_id, ())
+            if (text := message_text(msg.get("content", ""))).strip()
+        ]
 
-        for msg in history:
-            role = msg.get("role", "")
-            content = msg.get("content", "")
+    @classmethod
+    def is_available_voice(cls, voice: object) -> bool:
+        """Check whether a client-supplied value names an available voice.
 
-            if isinstance(content, str) and content.strip():
-                formatted.append({"role": role, "content": content})
-            elif isinstance(content, list):
-                text_parts = []
-                for block in content:
-                    if isinstance(block, dict) and block.get("type") == "text":
-                        text_parts.append(block.get("text", ""))
-                if text_parts:
-                    formatted.append({"role": role, "content": " ".join(text_parts)})
+        Args:
+            voice: The requested voice, which may be any JSON value.
 
-        return formatted
+        Returns:
+            True if the voice is a string in AVAILABLE_VOICES.
+        """
+        return isinstance(voice, str) and voice in cls.AVAILABLE_VOICES
 
     @property
     def available_voices(self) -> list[Voice]:
-        """List of available TTS voices."""
-        return self._tts.available_voices
+        """List of available TTS voices, from the same names as AVAILABLE_VOICES."""
+        return list(_VOICE_NAMES)
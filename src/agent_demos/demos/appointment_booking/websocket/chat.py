@@ -8,6 +8,11 @@ from typing import TYPE_CHECKING
 from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
 
 from agent_demos.demos.appointment_booking.websocket.auth import authenticate_websocket
+from agent_demos.demos.appointment_booking.websocket.protocol import (
+    receive_json,
+    send_connected,
+    send_json,
+)
 
 from agent_demos.demos.appointment_booking.rate_limit import check_ws_rate_limit
 
@@ -51,15 +56,12 @@ async def websocket_chat(
     session_id = await manager.connect(websocket, session_id)
 
     # Send session ID to client
-    await websocket.send_json({
-        "type": "connected",
-        "session_id": session_id,
-    })
+    await send_connected(websocket, session_id)
 
     # Send any existing history
     history = app_state.chat_service.format_history_for_client(session_id)
     if history:
-        await websocket.send_json({
+        await send_json(websocket, {
             "type": "history",
             "messages": history,
         })
@@ -67,7 +69,7 @@ async def websocket_chat(
     try:
         while True:
             # Receive message from client
-            data = await websocket.receive_json()
+            data = await receive_json(websocket)
             message_type = data.get("type", "message")
 
             if message_type == "message":
@@ -82,7 +84,7 @@ async def websocket_chat(
                     continue
 
                 # Send acknowledgment
-                await websocket.send_json({
+                await send_json(websocket, {
                     "type": "ack",
                     "status": "processing",
                 })
@@ -95,7 +97,7 @@ async def websocket_chat(
                     )
 
                     # Send response
-                    await websocket.send_json({
+                    await send_json(websocket, {
                         "type": "response",
                         "content": response,
                         "appointments_changed": appointments_changed,
@@ -106,16 +108,16 @@ async def websocket_chat(
                         "Error processing chat message for session %s",
                         session_id,
                     )
-                    await websocket.send_json(format_error_for_websocket(e))
+                    await send_json(websocket, format_error_for_websocket(e))
 
             elif message_type == "clear_history":
                 app_state.chat_service.clear_history(session_id)
-                await websocket.send_json({
+                await send_json(websocket, {
                     "type": "history_cleared",
                 })
 
             elif message_type == "ping":
-                await websocket.send_json({"type": "pong"})
+                await send_json(websocket, {"type": "pong"})
 
     except WebSocketDisconnect:
         logger.debug("Chat WebSocket disconnected: session %s", session_id)
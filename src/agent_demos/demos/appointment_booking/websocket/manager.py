@@ -2,19 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
 import uuid
+from collections import deque
 from typing import Any
 
 from fastapi import WebSocket
 
+from agent_demos.demos.appointment_booking.websocket.protocol import encode_json, send_json
+
 
 class ConnectionManager:
     """Manages WebSocket connections and message broadcasting."""
 
+    __slots__ = ("_connections", "_session_history")
+
+    # Oldest messages are dropped once a session's history reaches this size
+    MAX_HISTORY_MESSAGES = 1024
+
     def __init__(self) -> None:
         """Initialize the connection manager."""
         self._connections: dict[str, WebSocket] = {}
-        self._session_history: dict[str, list[dict[str, Any]]] = {}
+        self._session_history: dict[str, deque[dict[str, Any]]] = {}
 
     async def connect(self, websocket: WebSocket, session_id: str | None = None) -> str:
         """Accept a new WebSocket connection.
@@ -27,11 +36,11 @@ class ConnectionManager:
             The session ID for this connection.
         """
         await websocket.accept()
-        session_id = session_id or str(uuid.uuid4())
+        session_id = session_id or uuid.uuid4().hex
         self._connections[session_id] = websocket
 
         if session_id not in self._session_history:
-            self._session_history[session_id] = []
+            self._session_history[session_id] = deque(maxlen=self.MAX_HISTORY_MESSAGES)
 
         return session_id
 
@@ -62,7 +71,7 @@ class ConnectionManager:
         Returns:
             List of message history for the session.
         """
-        return self._session_history.get(session_id, [])
+        return list(self._session_history.get(session_id, ()))
 
     def add_to_history(self, session_id: str, message: dict[str, Any]) -> None:
         """Add a message to session history.
@@ -72,7 +81,7 @@ class ConnectionManager:
             message: The message to add.
         """
         if session_id not in self._session_history:
-            self._session_history[session_id] = []
+            self._session_history[session_id] = deque(maxlen=self.MAX_HISTORY_MESSAGES)
         self._session_history[session_id].append(message)
 
     def clear_history(self, session_id: str) -> None:
@@ -81,7 +90,7 @@ class ConnectionManager:
         Args:
             session_id: The session ID.
         """
-        self._session_history[session_id] = []
+        self._session_history[session_id] = deque(maxlen=self.MAX_HISTORY_MESSAGES)
 
     async def send_message(self, session_id: str, message: dict[str, Any]) -> bool:
         """Send a message to a specific connection.
@@ -96,7 +105,7 @@ class ConnectionManager:
         websocket = self._connections.get(session_id)
         if websocket:
             try:
-                await websocket.send_json(message)
+                await send_json(websocket, message)
                 return True
             except Exception:
                 self.disconnect(session_id)
@@ -108,16 +117,19 @@ class ConnectionManager:
         Args:
             message: The message to broadcast.
         """
-        disconnected = []
-        for session_id, websocket in self._connections.items():
-            try:
-                await websocket.send_json(message)
-            except Exception:
-                disconnected.append(session_id)
-
-        # Clean up disconnected clients
-        for session_id in disconnected:
-            self.disconnect(session_id)
+        # Encode once, then send to every client concurrently so one slow
+        # socket doesn't delay the rest
+        frame = encode_json(message)
+        connections = list(self._connections.items())
+        results = await asyncio.gather(
+            *(websocket.send_text(frame) for _, websocket in connections),
+            return_exceptions=True,
+        )
+
+        # Clean up disconnected clients, unless the session reconnected meanwhile
+        for (session_id, websocket), result in zip(connections, results):
+            if isinstance(result, Exception) and self._connections.get(session_id) is websocket:
+                self.disconnect(session_id)
 
     @property
     def active_connections(self) -> int:
@@ -0,0 +1,87 @@
+"""JSON framing helpers for the WebSocket endpoints."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any
+
+import orjson
+from fastapi import WebSocket, WebSocketDisconnect
+
+# Constant head of the greeting frame; only the session ID (and voices) vary
+_CONNECTED_PREFIX = '{"type":"connected","session_id":'
+
+
+@lru_cache(maxsize=8)
+def _encode_voices(voices: tuple[str, ...]) -> str:
+    """Encode a voice list once per distinct list."""
+    return orjson.dumps(voices).decode()
+
+
+def encode_json(message: dict[str, Any]) -> str:
+    """Encode a message as the text of a JSON frame.
+
+    Args:
+        message: The message to encode.
+
+    Returns:
+        Compact JSON, as text.
+    """
+    return orjson.dumps(message).decode()
+
+
+async def send_json(websocket: WebSocket, message: dict[str, Any]) -> None:
+    """Send a message as a JSON text frame.
+
+    Encodes with orjson instead of the stdlib encoder used by
+    ``WebSocket.send_json``. Output is still a compact UTF-8 text frame, so
+    browser clients parse it exactly as before.
+
+    Args:
+        websocket: The WebSocket connection.
+        message: The message to send.
+    """
+    await websocket.send_text(encode_json(message))
+
+
+async def receive_json(websocket: WebSocket) -> Any:
+    """Receive a JSON message from either a text or a binary frame.
+
+    Args:
+        websocket: The WebSocket connection.
+
+    Returns:
+        The decoded message.
+
+    Raises:
+        WebSocketDisconnect: If the client disconnected.
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+
+    text = message.get("text")
+    return orjson.loads(text if text is not None else message["bytes"])
+
+
+async def send_connected(
+    websocket: WebSocket,
+    session_id: str,
+    voices: Sequence[str] | None = None,
+) -> None:
+    """Send the ``connected`` greeting frame.
+
+    Builds the frame from a precomputed prefix and a cached voices array, so
+    a connect only encodes the session ID. The session ID is still JSON
+    encoded since it comes from the client's query string.
+
+    Args:
+        websocket: The WebSocket connection.
+        session_id: The session ID assigned to this connection.
+        voices: Available TTS voices, included when given.
+    """
+    frame = _CONNECTED_PREFIX + orjson.dumps(session_id).decode()
+    if voices is not None:
+        frame += ',"voices":' + _encode_voices(tuple(voices))
+    await websocket.send_text(frame + "}")
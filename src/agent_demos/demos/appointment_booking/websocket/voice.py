@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
 
 from agent_demos.demos.appointment_booking.websocket.auth import authenticate_websocket
+from agent_demos.demos.appointment_booking.websocket.protocol import (
+    receive_json,
+    send_connected,
+    send_json,
+)
 
 from agent_demos.demos.appointment_booking.rate_limit import check_ws_rate_limit
 
@@ -19,6 +24,7 @@ from agent_demos.core.exceptions import (
 from agent_demos.demos.appointment_booking.error_handlers import (
     format_error_for_websocket,
 )
+from agent_demos.demos.appointment_booking.services.voice_service import VoiceService
 
 if TYPE_CHECKING:
     from agent_demos.demos.appointment_booking.app import AppState
@@ -45,7 +51,7 @@ async def websocket_voice(
     Message types from client:
         - audio: { type: "audio", data: "<base64>", mime_type: "audio/webm" }
         - transcribe: { type: "transcribe", data: "<base64>", mime_type: "audio/webm" }
-        - synthesize: { type: "synthesize", text: "Hello" }
+        - synthesize: { type: "synthesize", text: "Hello", voice?: "nova" }
         - clear_history: { type: "clear_history" }
         - ping: { type: "ping" }
 
@@ -75,16 +81,12 @@ async def websocket_voice(
     session_id = await manager.connect(websocket, session_id)
 
     # Send session ID to client
-    await websocket.send_json({
-        "type": "connected",
-        "session_id": session_id,
-        "voices": app_state.voice_service.available_voices,
-    })
+    await send_connected(websocket, session_id, app_state.voice_service.available_voices)
 
     # Send any existing history
     history = app_state.voice_service.format_history_for_client(session_id)
     if history:
-        await websocket.send_json({
+        await send_json(websocket, {
             "type": "history",
             "messages": history,
         })
@@ -92,42 +94,38 @@ async def websocket_voice(
     try:
         while True:
             # Receive message from client
-            data = await websocket.receive_json()
+            data = await receive_json(websocket)
             message_type = data.get("type", "")
 
-            if message_type == "audio":
+            if message_type in ("audio", "transcribe", "synthesize"):
                 # Check rate limit for resource-intensive operations
                 if not await check_ws_rate_limit(
                     websocket, app_state.rate_limiter, session_id
                 ):
                     continue
-                # Full voice pipeline: audio -> transcription -> Claude -> synthesis
-                await _handle_audio_message(websocket, app_state, session_id, data)
 
-            elif message_type == "transcribe":
-                # Check rate limit for resource-intensive operations
-                if not await check_ws_rate_limit(
-                    websocket, app_state.rate_limiter, session_id
-                ):
+                # Reject empty payloads before any pipeline work starts
+                error = _validate(message_type, data)
+                if error is not None:
+                    await send_json(websocket, format_error_for_websocket(error))
                     continue
-                # Transcribe only (voice-to-text preview)
-                await _handle_transcribe_message(websocket, app_state, data)
 
-            elif message_type == "synthesize":
-                # Check rate limit for resource-intensive operations
-                if not await check_ws_rate_limit(
-                    websocket, app_state.rate_limiter, session_id
-                ):
-                    continue
-                # Synthesize text to audio
-                await _handle_synthesize_message(websocket, app_state, data)
+                if message_type == "audio":
+                    # Full voice pipeline: audio -> transcription -> Claude -> synthesis
+                    await _handle_audio_message(websocket, app_state, session_id, data)
+                elif message_type == "transcribe":
+                    # Transcribe only (voice-to-text preview)
+                    await _handle_transcribe_message(websocket, app_state, data)
+                else:
+                    # Synthesize text to audio
+                    await _handle_synthesize_message(websocket, app_state, data)
 
             elif message_type == "clear_history":
                 app_state.voice_service.clear_history(session_id)
-                await websocket.send_json({"type": "history_cleared"})
+                await send_json(websocket, {"type": "history_cleared"})
 
             elif message_type == "ping":
-                await websocket.send_json({"type": "pong"})
+                await send_json(websocket, {"type": "pong"})
 
     except WebSocketDisconnect:
         logger.debug("Voice WebSocket disconnected: session %s", session_id)
@@ -141,6 +139,36 @@ async def websocket_voice(
         manager.disconnect(session_id)
 
 
+def _validate(message_type: str, data: dict[str, Any]) -> AudioProcessingError | None:
+    """Check that a pipeline message carries the payload it needs.
+
+    Args:
+        message_type: The message type ("audio", "transcribe" or "synthesize").
+        data: Message data from the client.
+
+    Returns:
+        The validation error to report, or None if the message can be handled.
+    """
+    if message_type == "synthesize":
+        if not data.get("text", "").strip():
+            return AudioProcessingError(
+                message="No text provided for synthesis",
+                stage="validation",
+            )
+        voice = data.get("voice")
+        if voice is not None and not VoiceService.is_available_voice(voice):
+            return AudioProcessingError(
+                message=f"Unknown voice: {voice}",
+                stage="validation",
+            )
+    elif not data.get("data", ""):
+        return AudioProcessingError(
+            message="No audio data provided",
+            stage="validation",
+        )
+    return None
+
+
 async def _handle_audio_message(
     websocket: WebSocket,
     app_state: AppState,
@@ -153,25 +181,17 @@ async def _handle_audio_message(
         websocket: WebSocket connection.
         app_state: Application state.
         session_id: Session ID.
-        data: Message data with audio.
+        data: Message data with audio, already checked by ``_validate``.
     """
-    audio_base64 = data.get("data", "")
+    audio_base64 = data["data"]
     mime_type = data.get("mime_type", "audio/webm")
 
-    if not audio_base64:
-        error = AudioProcessingError(
-            message="No audio data provided",
-            stage="validation",
-        )
-        await websocket.send_json(format_error_for_websocket(error))
-        return
-
     voice_service = app_state.voice_service
     transcribed_text = None
 
     try:
         # Notify: transcribing
-        await websocket.send_json({
+        await send_json(websocket, {
             "type": "processing",
             "stage": "transcribing",
         })
@@ -188,7 +208,7 @@ async def _handle_audio_message(
             ) from e
 
         if not transcribed_text.strip():
-            await websocket.send_json({
+            await send_json(websocket, {
                 "type": "response",
                 "text": "",
                 "transcription": "",
@@ -200,13 +220,13 @@ async def _handle_audio_message(
             return
 
         # Send transcription immediately
-        await websocket.send_json({
+        await send_json(websocket, {
             "type": "transcription",
             "text": transcribed_text,
         })
 
         # Notify: thinking
-        await websocket.send_json({
+        await send_json(websocket, {
             "type": "processing",
             "stage": "thinking",
         })
@@ -226,7 +246,7 @@ async def _handle_audio_message(
             ) from e
 
         # Notify: synthesizing
-        await websocket.send_json({
+        await send_json(websocket, {
             "type": "processing",
             "stage": "synthesizing",
         })
@@ -242,7 +262,7 @@ async def _handle_audio_message(
             ) from e
 
         # Send complete response
-        await websocket.send_json({
+        await send_json(websocket, {
             "type": "response",
             "transcription": transcribed_text,
             "text": response_text,
@@ -253,7 +273,7 @@ async def _handle_audio_message(
 
     except Exception as e:
         logger.exception("Error processing audio for session %s", session_id)
-        await websocket.send_json(format_error_for_websocket(e))
+        await send_json(websocket, format_error_for_websocket(e))
 
 
 async def _handle_transcribe_message(
@@ -266,28 +286,20 @@ async def _handle_transcribe_message(
     Args:
         websocket: WebSocket connection.
         app_state: Application state.
-        data: Message data with audio.
+        data: Message data with audio, already checked by ``_validate``.
     """
-    audio_base64 = data.get("data", "")
+    audio_base64 = data["data"]
     mime_type = data.get("mime_type", "audio/webm")
 
-    if not audio_base64:
-        error = AudioProcessingError(
-            message="No audio data provided",
-            stage="validation",
-        )
-        await websocket.send_json(format_error_for_websocket(error))
-        return
-
     try:
-        await websocket.send_json({
+        await send_json(websocket, {
             "type": "processing",
             "stage": "transcribing",
         })
 
         text = await app_state.voice_service.transcribe_only(audio_base64, mime_type)
 
-        await websocket.send_json({
+        await send_json(websocket, {
             "type": "transcription",
             "text": text,
         })
@@ -299,7 +311,7 @@ async def _handle_transcribe_message(
             stage="transcription",
             details={"original_error": str(e)},
         )
-        await websocket.send_json(format_error_for_websocket(error))
+        await send_json(websocket, format_error_for_websocket(error))
 
 
 async def _handle_synthesize_message(
@@ -312,28 +324,20 @@ async def _handle_synthesize_message(
     Args:
         websocket: WebSocket connection.
         app_state: Application state.
-        data: Message data with text.
+        data: Message data with text, already checked by ``_validate``.
     """
-    text = data.get("text", "")
+    text = data["text"]
     voice = data.get("voice")
 
-    if not text.strip():
-        error = AudioProcessingError(
-            message="No text provided for synthesis",
-            stage="validation",
-        )
-        await websocket.send_json(format_error_for_websocket(error))
-        return
-
     try:
-        await websocket.send_json({
+        await send_json(websocket, {
             "type": "processing",
             "stage": "synthesizing",
         })
 
         audio_base64, mime_type = await app_state.voice_service.synthesize_only(text, voice)
 
-        await websocket.send_json({
+        await send_json(websocket, {
             "type": "audio",
             "data": audio_base64,
             "mime_type": mime_type,
@@ -345,4 +349,4 @@ async def _handle_synthesize_message(
             message="Failed to synthesize audio",
             details={"original_error": str(e)},
         )
-        await websocket.send_json(format_error_for_websocket(error))
+        await send_json(websocket, format_error_for_websocket(error))
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import json
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -14,11 +19,36 @@ from httpx import ASGITransport, AsyncClient
 
 from agent_demos.demos.appointment_booking.app import AppState, create_app
 from agent_demos.demos.appointment_booking.config import Settings
+from agent_demos.demos.appointment_booking.rate_limit import RateLimiter, RateLimitMiddleware
 from agent_demos.demos.appointment_booking.services.chat_service import ChatService
 from agent_demos.demos.appointment_booking.services.notification import NotificationService
 from agent_demos.demos.appointment_booking.services.voice_service import VoiceService
 from agent_demos.demos.appointment_booking.websocket.manager import ConnectionManager
 
+# uvloop ships with uvicorn[standard] everywhere except Windows and PyPy
+USE_UVLOOP = importlib.util.find_spec("uvloop") is not None
+
+
+def pytest_asyncio_loop_factories(
+    config: pytest.Config,
+    item: pytest.Item,
+) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """Run async tests on uvloop when it is installed.
+
+    Args:
+        config: The pytest config.
+        item: The test being set up.
+
+    Returns:
+        The uvloop loop factory, or the standard asyncio one when uvloop is
+        not installed.
+    """
+    if not USE_UVLOOP:
+        return {"asyncio": asyncio.new_event_loop}
+    import uvloop
+
+    return {"uvloop": uvloop.new_event_loop}
+
 
 # =============================================================================
 # Mock Implementations
@@ -277,6 +307,11 @@ class MockGoogleCalendarClient:
             current = slot_end
         return slots[:10]  # Limit for testing
 
+    def clear(self) -> None:
+        """Remove all events and restart event ID numbering."""
+        self._events.clear()
+        self._event_counter = 0
+
 
 class MockSchedulingAgent:
     """Mock implementation of SchedulingAgent for testing."""
@@ -296,7 +331,14 @@ class MockSchedulingAgent:
             calendar_id=calendar_id,
         )
         self._claude = MockClaudeClient(api_key=api_key, model=model)
+        self._queued_responses: deque[str] = deque()
+        self.reset()
+
+    def reset(self) -> None:
+        """Restore the default response, drop queued ones, and clear calendar events."""
         self._response_text = "I can help you with that."
+        self._queued_responses.clear()
+        self._calendar.clear()
 
     @property
     def calendar(self) -> MockGoogleCalendarClient:
@@ -312,13 +354,27 @@ class MockSchedulingAgent:
         """Set the response to return from chat methods."""
         self._response_text = response
 
+    def set_responses(self, *responses: str) -> None:
+        """Queue responses for successive chat calls, one per call.
+
+        Once the queue runs out, calls return the ``set_response`` text.
+        """
+        self._queued_responses.clear()
+        self._queued_responses.extend(responses)
+
+    def _next_response(self) -> str:
+        """Take the next queued response, or the fixed one."""
+        if self._queued_responses:
+            return self._queued_responses.popleft()
+        return self._response_text
+
     def chat(
         self,
         message: str,
         system_prompt: str | None = None,
     ) -> str:
         """Process a message."""
-        return self._response_text
+        return self._next_response()
 
     def chat_with_history(
         self,
@@ -327,10 +383,11 @@ class MockSchedulingAgent:
         system_prompt: str | None = None,
     ) -> tuple[str, list[dict[str, Any]]]:
         """Process a message with history."""
+        response = self._next_response()
         conversation = list(history) if history else []
         conversation.append({"role": "user", "content": message})
-        conversation.append({"role": "assistant", "content": self._response_text})
-        return self._response_text, conversation
+        conversation.append({"role": "assistant", "content": response})
+        return response, conversation
 
     async def chat_async(
         self,
@@ -338,7 +395,7 @@ class MockSchedulingAgent:
         system_prompt: str | None = None,
     ) -> str:
         """Async version of chat."""
-        return self._response_text
+        return self._next_response()
 
     async def chat_with_history_async(
         self,
@@ -360,6 +417,10 @@ class MockWebSTT:
     ) -> None:
         """Initialize mock STT."""
         self._api_key = api_key
+        self.reset()
+
+    def reset(self) -> None:
+        """Restore the default transcription."""
         self._transcription = "Hello, I would like to book an appointment."
 
     def set_transcription(self, text: str) -> None:
@@ -389,6 +450,7 @@ class MockWebTTS:
     """Mock implementation of WebTTS for testing."""
 
     DEFAULT_WEB_FORMAT = "mp3"
+    VOICES = ("alloy", "echo", "fable", "nova", "onyx", "shimmer")
 
     def __init__(
         self,
@@ -399,6 +461,10 @@ class MockWebTTS:
         """Initialize mock TTS."""
         self._api_key = api_key
         self._voice = voice
+        self.reset()
+
+    def reset(self) -> None:
+        """Restore the default audio response."""
         self._audio_base64 = "SGVsbG8gV29ybGQ="  # "Hello World" in base64
 
     def set_audio_response(self, audio_base64: str) -> None:
@@ -427,8 +493,59 @@ class MockWebTTS:
 
     @property
     def available_voices(self) -> list[str]:
-        """Get available voices."""
-        return ["alloy", "echo", "fable", "nova", "onyx", "shimmer"]
+        """Get available voices, as a list like the real WebTTS."""
+        return list(self.VOICES)
+
+
+class MockWebSocket:
+    """Minimal stand-in for a server-side WebSocket in manager tests."""
+
+    def __init__(
+        self,
+        send_error: Exception | None = None,
+        close_error: Exception | None = None,
+    ) -> None:
+        """Initialize mock WebSocket."""
+        self.sent: list[dict[str, Any]] = []
+        self.accepted = False
+        self.closed = False
+        self._send_error = send_error
+        self._close_error = close_error
+
+    async def accept(self) -> None:
+        """Accept the connection."""
+        self.accepted = True
+
+    async def send_text(self, data: str) -> None:
+        """Record a sent JSON frame's message, or raise the configured send error."""
+        if self._send_error is not None:
+            raise self._send_error
+        self.sent.append(json.loads(data))
+
+    async def close(self) -> None:
+        """Close the connection, or raise the configured close error."""
+        if self._close_error is not None:
+            raise self._close_error
+        self.closed = True
+
+
+class MockConnectionManager:
+    """Records broadcasts and direct messages for notification tests."""
+
+    def __init__(self, connected: bool = True) -> None:
+        """Initialize mock connection manager."""
+        self.broadcasts: list[dict[str, Any]] = []
+        self.sent: list[tuple[str, dict[str, Any]]] = []
+        self._connected = connected
+
+    async def broadcast(self, message: dict[str, Any]) -> None:
+        """Record a broadcast message."""
+        self.broadcasts.append(message)
+
+    async def send_message(self, session_id: str, message: dict[str, Any]) -> bool:
+        """Record a direct message and report whether the session exists."""
+        self.sent.append((session_id, message))
+        return self._connected
 
 
 # =============================================================================
@@ -436,7 +553,7 @@ class MockWebTTS:
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_settings() -> Settings:
     """Create test settings."""
     return Settings(
@@ -456,6 +573,22 @@ def test_settings() -> Settings:
 # =============================================================================
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _block_openai_clients() -> Iterator[None]:
+    """Replace the OpenAI client class so no test can reach the real API.
+
+    Services built with a test key still construct STT and TTS wrappers
+    before tests swap in the mocks; this keeps those wrappers from creating
+    real HTTP clients, and turns any call that slips past a mock into a
+    MagicMock call instead of a network request.
+    """
+    with (
+        patch("agent_demos.voice.stt.OpenAI"),
+        patch("agent_demos.voice.tts.OpenAI"),
+    ):
+        yield
+
+
 @pytest.fixture
 def mock_claude() -> MockClaudeClient:
     """Create a mock Claude client."""
@@ -468,47 +601,68 @@ def mock_calendar() -> MockGoogleCalendarClient:
     return MockGoogleCalendarClient()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_scheduling_agent() -> MockSchedulingAgent:
-    """Create a mock scheduling agent."""
+    """Create the mock scheduling agent shared by the whole session."""
     return MockSchedulingAgent()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_stt() -> MockWebSTT:
-    """Create a mock STT client."""
+    """Create the mock STT client shared by the whole session."""
     return MockWebSTT()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_tts() -> MockWebTTS:
-    """Create a mock TTS client."""
+    """Create the mock TTS client shared by the whole session."""
     return MockWebTTS()
 
 
+@pytest.fixture(autouse=True)
+def _reset_mocks(
+    mock_scheduling_agent: MockSchedulingAgent,
+    mock_stt: MockWebSTT,
+    mock_tts: MockWebTTS,
+) -> Iterator[None]:
+    """Reset the shared mocks after each test so the next one starts clean."""
+    yield
+    mock_scheduling_agent.reset()
+    mock_stt.reset()
+    mock_tts.reset()
+
+
 # =============================================================================
 # Service Fixtures
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def connection_manager() -> ConnectionManager:
-    """Create a connection manager."""
+    """Create the connection manager shared by the whole session."""
     return ConnectionManager()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def notification_service(connection_manager: ConnectionManager) -> NotificationService:
-    """Create a notification service."""
+    """Create the notification service shared by the whole session."""
     return NotificationService(connection_manager)
 
 
-@pytest.fixture
-def chat_service(
+@pytest.fixture(autouse=True)
+def _reset_connection_manager(connection_manager: ConnectionManager) -> Iterator[None]:
+    """Drop connections and history after each test so the next one starts clean."""
+    yield
+    connection_manager._connections.clear()
+    connection_manager._session_history.clear()
+
+
+@pytest.fixture(scope="module")
+def shared_chat_service(
     mock_scheduling_agent: MockSchedulingAgent,
     notification_service: NotificationService,
 ) -> ChatService:
-    """Create a chat service with mocked dependencies."""
+    """Create a chat service with mocked dependencies, shared per module."""
     return ChatService(
         scheduling_agent=mock_scheduling_agent,  # type: ignore
         notification_service=notification_service,
@@ -516,13 +670,20 @@ def chat_service(
 
 
 @pytest.fixture
-def voice_service(
+def chat_service(shared_chat_service: ChatService) -> Iterator[ChatService]:
+    """Provide the shared chat service, dropping its sessions after the test."""
+    yield shared_chat_service
+    shared_chat_service._sessions.clear()
+
+
+@pytest.fixture(scope="module")
+def shared_voice_service(
     mock_scheduling_agent: MockSchedulingAgent,
     notification_service: NotificationService,
     mock_stt: MockWebSTT,
     mock_tts: MockWebTTS,
 ) -> VoiceService:
-    """Create a voice service with mocked dependencies."""
+    """Create a voice service with mocked dependencies, shared per module."""
     service = VoiceService(
         scheduling_agent=mock_scheduling_agent,  # type: ignore
         notification_service=notification_service,
@@ -534,20 +695,80 @@ def voice_service(
     return service
 
 
+@pytest.fixture
+def voice_service(shared_voice_service: VoiceService) -> Iterator[VoiceService]:
+    """Provide the shared voice service, dropping its sessions after the test."""
+    yield shared_voice_service
+    shared_voice_service._sessions.clear()
+
+
 # =============================================================================
 # App Fixtures
 # =============================================================================
 
 
+@pytest.fixture(scope="session")
+def app(test_settings: Settings) -> Iterator[FastAPI]:
+    """Create the test FastAPI application shared by the whole session."""
+    # Patch validate_startup_credentials to skip file existence checks in tests
+    with patch(
+        "agent_demos.demos.appointment_booking.app.validate_startup_credentials"
+    ):
+        yield create_app(test_settings)
+
+
+@pytest.fixture(scope="session")
+def rate_limiter(app: FastAPI) -> RateLimiter:
+    """Get the rate limiter wired into the shared app's HTTP middleware."""
+    for middleware in app.user_middleware:
+        if middleware.cls is RateLimitMiddleware:  # type: ignore
+            return middleware.kwargs["rate_limiter"]  # type: ignore
+    raise LookupError("RateLimitMiddleware is not installed on the test app")
+
+
+@pytest.fixture(scope="session")
+def session_client(app: FastAPI) -> Iterator[TestClient]:
+    """Create one test client, entered once so lifespan and portal are reused."""
+    with TestClient(app, backend_options={"use_uvloop": USE_UVLOOP}) as test_client:
+        yield test_client
+
+
+@contextmanager
+def entered_client(app: FastAPI) -> Iterator[TestClient]:
+    """Enter a test client for an app whose state the test built by hand.
+
+    Entering runs the app lifespan, which installs a fresh ``AppState``; the
+    state set on ``app`` beforehand is put back once startup has finished.
+    Keeping the client entered reuses one portal and event loop for every
+    request and websocket session made through it.
+
+    Args:
+        app: The app, with ``app.state.app_state`` already set.
+
+    Yields:
+        The entered test client.
+    """
+    app_state = app.state.app_state
+    with (
+        patch("agent_demos.demos.appointment_booking.app.validate_startup_credentials"),
+        TestClient(app, backend_options={"use_uvloop": USE_UVLOOP}) as test_client,
+    ):
+        app.state.app_state = app_state
+        yield test_client
+
+
 @pytest.fixture
 def mock_app_state(
     test_settings: Settings,
+    rate_limiter: RateLimiter,
     mock_scheduling_agent: MockSchedulingAgent,
     mock_stt: MockWebSTT,
     mock_tts: MockWebTTS,
 ) -> AppState:
     """Create a mock app state for testing."""
-    app_state = AppState(test_settings)
+    # Share the middleware's limiter like the real lifespan does, starting empty
+    rate_limiter.reset()
+    app_state = AppState(test_settings, rate_limiter)
     # Inject mock scheduling agent
     app_state._scheduling_agent = mock_scheduling_agent  # type: ignore
 
@@ -570,27 +791,21 @@ def mock_app_state(
 
 
 @pytest.fixture
-def app(mock_app_state: AppState, test_settings: Settings) -> FastAPI:
-    """Create a test FastAPI application with mocked dependencies."""
-    # Patch validate_startup_credentials to skip file existence checks in tests
-    with patch(
-        "agent_demos.demos.appointment_booking.app.validate_startup_credentials"
-    ):
-        test_app = create_app(test_settings)
-        # Override the app state
-        test_app.state.app_state = mock_app_state
-        yield test_app
-
-
-@pytest.fixture
-def client(app: FastAPI) -> TestClient:
-    """Create a test client."""
-    return TestClient(app)
+def client(
+    session_client: TestClient,
+    app: FastAPI,
+    mock_app_state: AppState,
+) -> TestClient:
+    """Get the shared test client with this test's mocked state installed."""
+    # Swapping in fresh state isolates tests without rebuilding the app
+    app.state.app_state = mock_app_state
+    return session_client
 
 
 @pytest.fixture
-async def async_client(app: FastAPI) -> AsyncClient:
+async def async_client(app: FastAPI, mock_app_state: AppState) -> AsyncClient:
     """Create an async test client."""
+    app.state.app_state = mock_app_state
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
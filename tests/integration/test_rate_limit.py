@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -9,14 +11,14 @@ from agent_demos.demos.appointment_booking.app import AppState, create_app
 from agent_demos.demos.appointment_booking.config import Settings
 from agent_demos.demos.appointment_booking.rate_limit import RateLimitConfig, RateLimiter
 
-from tests.conftest import MockSchedulingAgent
+from tests.conftest import MockSchedulingAgent, entered_client
 
 
 class TestHttpRateLimiting:
     """Tests for HTTP rate limiting middleware."""
 
     @pytest.fixture
-    def rate_limited_client(self) -> TestClient:
+    def rate_limited_client(self) -> Iterator[TestClient]:
         """Create a test client with aggressive rate limiting."""
         settings = Settings(
             anthropic_api_key="test-key",
@@ -27,7 +29,7 @@ class TestHttpRateLimiting:
         )
         app = create_app(settings)
 
-        # Manually set up app state to avoid needing lifespan
+        # Manually set up app state; entered_client restores it after startup
         rate_limiter = RateLimiter(
             RateLimitConfig(
                 http_requests_per_minute=60,
@@ -41,7 +43,8 @@ class TestHttpRateLimiting:
         app_state._scheduling_agent = MockSchedulingAgent()  # type: ignore
         app.state.app_state = app_state
 
-        return TestClient(app)
+        with entered_client(app) as client:
+            yield client
 
     def test_requests_within_limit(self, rate_limited_client: TestClient) -> None:
         """Test requests within rate limit are allowed."""
@@ -90,7 +93,7 @@ class TestRateLimitingDisabled:
     """Tests for disabled rate limiting."""
 
     @pytest.fixture
-    def unlimited_client(self) -> TestClient:
+    def unlimited_client(self) -> Iterator[TestClient]:
         """Create a test client with rate limiting disabled."""
         settings = Settings(
             anthropic_api_key="test-key",
@@ -111,7 +114,8 @@ class TestRateLimitingDisabled:
         app_state._scheduling_agent = MockSchedulingAgent()  # type: ignore
         app.state.app_state = app_state
 
-        return TestClient(app)
+        with entered_client(app) as client:
+            yield client
 
     def test_unlimited_requests(self, unlimited_client: TestClient) -> None:
         """Test many requests allowed when rate limiting disabled."""
@@ -148,19 +152,18 @@ class TestRateLimitRecovery:
         app_state._scheduling_agent = MockSchedulingAgent()  # type: ignore
         app.state.app_state = app_state
 
-        client = TestClient(app)
-
-        # Exhaust burst immediately
-        client.get("/api/appointments")
-        client.get("/api/appointments")
+        with entered_client(app) as client:
+            # Exhaust burst immediately
+            client.get("/api/appointments")
+            client.get("/api/appointments")
 
-        # Third request should be rate limited
-        response = client.get("/api/appointments")
-        assert response.status_code == 429
+            # Third request should be rate limited
+            response = client.get("/api/appointments")
+            assert response.status_code == 429
 
-        # Wait 1.5 seconds for 1 token to refill (1 token/sec)
-        time.sleep(1.5)
+            # Wait 1.5 seconds for 1 token to refill (1 token/sec)
+            time.sleep(1.5)
 
-        # Should be allowed again
-        response = client.get("/api/appointments")
-        assert response.status_code == 200
+            # Should be allowed again
+            response = client.get("/api/appointments")
+            assert response.status_code == 200
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -15,7 +17,12 @@ from agent_demos.demos.appointment_booking.websocket.auth import (
     is_auth_enabled,
     verify_token,
 )
-from tests.conftest import MockSchedulingAgent, MockWebSTT, MockWebTTS
+from tests.conftest import (
+    MockSchedulingAgent,
+    MockWebSTT,
+    MockWebTTS,
+    entered_client,
+)
 
 # =============================================================================
 # Unit Tests for Auth Functions
@@ -119,9 +126,10 @@ def auth_app(
 
 
 @pytest.fixture
-def auth_client(auth_app: FastAPI) -> TestClient:
+def auth_client(auth_app: FastAPI) -> Iterator[TestClient]:
     """Create a test client with authentication enabled."""
-    return TestClient(auth_app)
+    with entered_client(auth_app) as client:
+        yield client
 
 
 class TestWebSocketChatAuthentication:
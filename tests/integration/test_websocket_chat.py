@@ -3,11 +3,32 @@
 from __future__ import annotations
 
 import pytest
-from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from tests.conftest import MockSchedulingAgent
 
+# Constant control frames, encoded once and sent with send_text
+PING = '{"type":"ping"}'
+CLEAR_HISTORY = '{"type":"clear_history"}'
+
+# Each step is (text frame to send, expected reply type or None for no reply)
+SCENARIOS = {
+    "ping_pong": [(PING, "pong")],
+    "multiple_pings": [(PING, "pong")] * 5,
+    "empty_message_ignored": [
+        ('{"type":"message","content":""}', None),
+        (PING, "pong"),
+    ],
+    "whitespace_message_ignored": [
+        ('{"type":"message","content":"   "}', None),
+        (PING, "pong"),
+    ],
+    "unknown_message_type": [
+        ('{"type":"unknown_type","data":"test"}', None),
+        (PING, "pong"),
+    ],
+}
+
 
 class TestWebSocketChatConnection:
     """Tests for WebSocket chat connection management."""
@@ -33,7 +54,6 @@ class TestWebSocketChatConnection:
         self,
         client: TestClient,
         mock_scheduling_agent: MockSchedulingAgent,
-        app: FastAPI,
     ) -> None:
         """Test reconnecting with same session ID maintains state."""
         session_id = "persistent-session"
@@ -84,32 +104,6 @@ class TestWebSocketChatMessaging:
             assert response["content"] == "I can help you with scheduling."
             assert "appointments_changed" in response
 
-    def test_send_empty_message(self, client: TestClient) -> None:
-        """Test that empty messages are ignored."""
-        with client.websocket_connect("/ws/chat") as websocket:
-            websocket.receive_json()  # connected message
-
-            # Send empty message
-            websocket.send_json({"type": "message", "content": ""})
-
-            # Send another message to verify connection still works
-            websocket.send_json({"type": "ping"})
-            pong = websocket.receive_json()
-            assert pong["type"] == "pong"
-
-    def test_send_whitespace_message(self, client: TestClient) -> None:
-        """Test that whitespace-only messages are ignored."""
-        with client.websocket_connect("/ws/chat") as websocket:
-            websocket.receive_json()  # connected message
-
-            # Send whitespace message
-            websocket.send_json({"type": "message", "content": "   "})
-
-            # Verify connection still works
-            websocket.send_json({"type": "ping"})
-            pong = websocket.receive_json()
-            assert pong["type"] == "pong"
-
     def test_message_with_appointment_changes(
         self,
         client: TestClient,
@@ -136,14 +130,15 @@ class TestWebSocketChatMessaging:
                 msg = websocket.receive_json()
                 messages.append(msg)
 
+            by_type = {m["type"]: m for m in messages}
+
             # Find the response message
-            response = next((m for m in messages if m["type"] == "response"), None)
+            response = by_type.get("response")
             assert response is not None
             assert response["appointments_changed"] is True
 
             # Check that notification was also sent
-            notification = next((m for m in messages if m["type"] == "notification"), None)
-            assert notification is not None
+            assert "notification" in by_type
 
     def test_multiple_messages(
         self,
@@ -166,30 +161,6 @@ class TestWebSocketChatMessaging:
                 assert response["content"] == f"Response {i}"
 
 
-class TestWebSocketChatPing:
-    """Tests for WebSocket chat ping/pong."""
-
-    def test_ping_pong(self, client: TestClient) -> None:
-        """Test ping/pong keepalive."""
-        with client.websocket_connect("/ws/chat") as websocket:
-            websocket.receive_json()  # connected
-
-            websocket.send_json({"type": "ping"})
-            response = websocket.receive_json()
-
-            assert response["type"] == "pong"
-
-    def test_multiple_pings(self, client: TestClient) -> None:
-        """Test multiple ping requests."""
-        with client.websocket_connect("/ws/chat") as websocket:
-            websocket.receive_json()  # connected
-
-            for _ in range(5):
-                websocket.send_json({"type": "ping"})
-                response = websocket.receive_json()
-                assert response["type"] == "pong"
-
-
 class TestWebSocketChatHistoryManagement:
     """Tests for WebSocket chat history management."""
 
@@ -210,7 +181,7 @@ class TestWebSocketChatHistoryManagement:
             websocket.receive_json()  # response
 
             # Clear history
-            websocket.send_json({"type": "clear_history"})
+            websocket.send_text(CLEAR_HISTORY)
             clear_response = websocket.receive_json()
 
             assert clear_response["type"] == "history_cleared"
@@ -219,19 +190,6 @@ class TestWebSocketChatHistoryManagement:
 class TestWebSocketChatUnknownMessageTypes:
     """Tests for handling unknown message types."""
 
-    def test_unknown_message_type(self, client: TestClient) -> None:
-        """Test that unknown message types don't crash the connection."""
-        with client.websocket_connect("/ws/chat") as websocket:
-            websocket.receive_json()  # connected
-
-            # Send unknown message type
-            websocket.send_json({"type": "unknown_type", "data": "test"})
-
-            # Connection should still work
-            websocket.send_json({"type": "ping"})
-            response = websocket.receive_json()
-            assert response["type"] == "pong"
-
     def test_malformed_message(
         self,
         client: TestClient,
@@ -252,6 +210,25 @@ class TestWebSocketChatUnknownMessageTypes:
             websocket.receive_json()  # response
 
             # Connection should still work
-            websocket.send_json({"type": "ping"})
+            websocket.send_text(PING)
             response = websocket.receive_json()
             assert response["type"] == "pong"
+
+
+class TestWebSocketChatScenarios:
+    """Send/receive scenarios that need no mock setup."""
+
+    @pytest.mark.parametrize("steps", list(SCENARIOS.values()), ids=list(SCENARIOS))
+    def test_scenario(
+        self,
+        client: TestClient,
+        steps: list[tuple[str, str | None]],
+    ) -> None:
+        """Test a scenario over a single connection."""
+        with client.websocket_connect("/ws/chat") as websocket:
+            websocket.receive_json()  # connected
+
+            for frame, expected_type in steps:
+                websocket.send_text(frame)
+                if expected_type is not None:
+                    assert websocket.receive_json()["type"] == expected_type
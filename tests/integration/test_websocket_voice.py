@@ -3,11 +3,30 @@
 from __future__ import annotations
 
 import pytest
-from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from tests.conftest import MockSchedulingAgent, MockWebSTT, MockWebTTS
 
+# Fixed base64 payloads; the mocked STT/TTS never decode them
+AUDIO_HELLO = "SGVsbG8="  # "Hello"
+AUDIO_HELLO_WORLD = "SGVsbG8gV29ybGQ="  # "Hello World"
+TTS_AUDIO = "YXVkaW9fZGF0YQ=="  # "audio_data"
+SYNTHESIZED_AUDIO = "c3ludGhlc2l6ZWRfYXVkaW8="  # "synthesized_audio"
+
+# Constant control frames, encoded once and sent with send_text
+PING = '{"type":"ping"}'
+CLEAR_HISTORY = '{"type":"clear_history"}'
+
+# Each step is (text frame to send, expected reply type or None for no reply)
+SCENARIOS = {
+    "ping_pong": [(PING, "pong")],
+    "multiple_pings": [(PING, "pong")] * 5,
+    "unknown_message_type": [
+        ('{"type":"unknown_type"}', None),
+        (PING, "pong"),
+    ],
+}
+
 
 class TestWebSocketVoiceConnection:
     """Tests for WebSocket voice connection management."""
@@ -52,7 +71,7 @@ class TestWebSocketVoiceAudioProcessing:
         """Test full audio processing pipeline."""
         mock_stt.set_transcription("Book a meeting for tomorrow")
         mock_scheduling_agent.set_response("I'll book that for you.")
-        mock_tts.set_audio_response("YXVkaW9fZGF0YQ==")
+        mock_tts.set_audio_response(TTS_AUDIO)
 
         with client.websocket_connect("/ws/voice") as websocket:
             websocket.receive_json()  # connected
@@ -60,32 +79,33 @@ class TestWebSocketVoiceAudioProcessing:
             # Send audio
             websocket.send_json({
                 "type": "audio",
-                "data": "SGVsbG8gV29ybGQ=",
+                "data": AUDIO_HELLO_WORLD,
                 "mime_type": "audio/webm",
             })
 
-            # Should receive processing status (transcribing)
             status1 = websocket.receive_json()
+            transcription = websocket.receive_json()
+            status2 = websocket.receive_json()
+            status3 = websocket.receive_json()
+            response = websocket.receive_json()
+
+            # Should receive processing status (transcribing)
             assert status1["type"] == "processing"
             assert status1["stage"] == "transcribing"
 
             # Should receive transcription
-            transcription = websocket.receive_json()
             assert transcription["type"] == "transcription"
             assert transcription["text"] == "Book a meeting for tomorrow"
 
             # Should receive processing status (thinking)
-            status2 = websocket.receive_json()
             assert status2["type"] == "processing"
             assert status2["stage"] == "thinking"
 
             # Should receive processing status (synthesizing)
-            status3 = websocket.receive_json()
             assert status3["type"] == "processing"
             assert status3["stage"] == "synthesizing"
 
             # Should receive final response
-            response = websocket.receive_json()
             assert response["type"] == "response"
             assert response["transcription"] == "Book a meeting for tomorrow"
             assert response["text"] == "I'll book that for you."
@@ -106,7 +126,7 @@ class TestWebSocketVoiceAudioProcessing:
 
             websocket.send_json({
                 "type": "audio",
-                "data": "SGVsbG8=",
+                "data": AUDIO_HELLO,
                 "mime_type": "audio/webm",
             })
 
@@ -149,24 +169,27 @@ class TestWebSocketVoiceAudioProcessing:
 
             websocket.send_json({
                 "type": "audio",
-                "data": "SGVsbG8=",
+                "data": AUDIO_HELLO,
                 "mime_type": "audio/webm",
             })
 
-            # Skip through processing messages
-            for _ in range(4):  # transcribing, transcription, thinking, synthesizing
-                websocket.receive_json()
+            # Five pipeline frames plus the change notification, which is
+            # broadcast while the reply is processed and can land between them
+            messages = [websocket.receive_json() for _ in range(6)]
+            notifications = [m for m in messages if m["type"] == "notification"]
+            pipeline = [m for m in messages if m["type"] != "notification"]
 
-            # When appointments change, we may receive notification before/after response
-            messages = []
-            for _ in range(2):  # Expect response and possibly notification
-                msg = websocket.receive_json()
-                messages.append(msg)
+            assert len(notifications) == 1
+            assert notifications[0]["event"] == "appointments_changed"
+            assert [(m["type"], m.get("stage")) for m in pipeline] == [
+                ("processing", "transcribing"),
+                ("transcription", None),
+                ("processing", "thinking"),
+                ("processing", "synthesizing"),
+                ("response", None),
+            ]
 
-            # Find the response message
-            response = next((m for m in messages if m["type"] == "response"), None)
-            assert response is not None
-            assert response["appointments_changed"] is True
+            assert pipeline[-1]["appointments_changed"] is True
 
 
 class TestWebSocketVoiceTranscribeOnly:
@@ -185,7 +208,7 @@ class TestWebSocketVoiceTranscribeOnly:
 
             websocket.send_json({
                 "type": "transcribe",
-                "data": "SGVsbG8=",
+                "data": AUDIO_HELLO,
                 "mime_type": "audio/webm",
             })
 
@@ -223,7 +246,7 @@ class TestWebSocketVoiceSynthesizeOnly:
         mock_tts: MockWebTTS,
     ) -> None:
         """Test text-to-speech synthesis."""
-        mock_tts.set_audio_response("c3ludGhlc2l6ZWRfYXVkaW8=")
+        mock_tts.set_audio_response(SYNTHESIZED_AUDIO)
 
         with client.websocket_connect("/ws/voice") as websocket:
             websocket.receive_json()  # connected
@@ -241,7 +264,7 @@ class TestWebSocketVoiceSynthesizeOnly:
             # Should receive audio
             audio = websocket.receive_json()
             assert audio["type"] == "audio"
-            assert audio["data"] == "c3ludGhlc2l6ZWRfYXVkaW8="
+            assert audio["data"] == SYNTHESIZED_AUDIO
             assert audio["mime_type"] == "audio/mpeg"
 
     def test_synthesize_only_no_text(self, client: TestClient) -> None:
@@ -272,6 +295,21 @@ class TestWebSocketVoiceSynthesizeOnly:
             assert response["type"] == "error"
             assert "No text" in response["message"]
 
+    def test_synthesize_unknown_voice(self, client: TestClient) -> None:
+        """Test synthesis request with a voice the TTS does not offer."""
+        with client.websocket_connect("/ws/voice") as websocket:
+            websocket.receive_json()  # connected
+
+            websocket.send_json({
+                "type": "synthesize",
+                "text": "Hello",
+                "voice": "robot",
+            })
+
+            response = websocket.receive_json()
+            assert response["type"] == "error"
+            assert "Unknown voice" in response["message"]
+
     def test_synthesize_with_voice(self, client: TestClient) -> None:
         """Test synthesis with specific voice."""
         with client.websocket_connect("/ws/voice") as websocket:
@@ -288,20 +326,6 @@ class TestWebSocketVoiceSynthesizeOnly:
             assert audio["type"] == "audio"
 
 
-class TestWebSocketVoicePing:
-    """Tests for WebSocket voice ping/pong."""
-
-    def test_ping_pong(self, client: TestClient) -> None:
-        """Test ping/pong keepalive."""
-        with client.websocket_connect("/ws/voice") as websocket:
-            websocket.receive_json()  # connected
-
-            websocket.send_json({"type": "ping"})
-            response = websocket.receive_json()
-
-            assert response["type"] == "pong"
-
-
 class TestWebSocketVoiceHistoryManagement:
     """Tests for WebSocket voice history management."""
 
@@ -321,7 +345,7 @@ class TestWebSocketVoiceHistoryManagement:
             # Process some audio first
             websocket.send_json({
                 "type": "audio",
-                "data": "SGVsbG8=",
+                "data": AUDIO_HELLO,
                 "mime_type": "audio/webm",
             })
 
@@ -330,38 +354,26 @@ class TestWebSocketVoiceHistoryManagement:
                 websocket.receive_json()
 
             # Clear history
-            websocket.send_json({"type": "clear_history"})
+            websocket.send_text(CLEAR_HISTORY)
             response = websocket.receive_json()
 
             assert response["type"] == "history_cleared"
 
 
-class TestWebSocketVoicePingPong:
-    """Additional tests for voice ping/pong."""
+class TestWebSocketVoiceScenarios:
+    """Send/receive scenarios that need no mock setup."""
 
-    def test_multiple_pings(self, client: TestClient) -> None:
-        """Test multiple ping/pong exchanges."""
-        with client.websocket_connect("/ws/voice") as websocket:
-            websocket.receive_json()  # connected
-
-            for _ in range(5):
-                websocket.send_json({"type": "ping"})
-                response = websocket.receive_json()
-                assert response["type"] == "pong"
-
-
-class TestWebSocketVoiceUnknownMessageTypes:
-    """Tests for handling unknown message types."""
-
-    def test_unknown_message_type(self, client: TestClient) -> None:
-        """Test that unknown message types don't crash the connection."""
+    @pytest.mark.parametrize("steps", list(SCENARIOS.values()), ids=list(SCENARIOS))
+    def test_scenario(
+        self,
+        client: TestClient,
+        steps: list[tuple[str, str | None]],
+    ) -> None:
+        """Test a scenario over a single connection."""
         with client.websocket_connect("/ws/voice") as websocket:
             websocket.receive_json()  # connected
 
-            # Send unknown message type
-            websocket.send_json({"type": "unknown_type"})
-
-            # Connection should still work
-            websocket.send_json({"type": "ping"})
-            response = websocket.receive_json()
-            assert response["type"] == "pong"
+            for frame, expected_type in steps:
+                websocket.send_text(frame)
+                if expected_type is not None:
+                    assert websocket.receive_json()["type"] == expected_type
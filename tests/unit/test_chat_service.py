@@ -10,6 +10,10 @@ import pytest
 from agent_demos.demos.appointment_booking.services.chat_service import ChatService
 from tests.conftest import MockSchedulingAgent, create_tool_result_history
 
+# Tool result payloads shared by the history-based detection tests
+SUCCESS_JSON = json.dumps({"success": True})
+FAILURE_JSON = json.dumps({"success": False})
+
 
 class TestChatServiceInit:
     """Tests for ChatService initialization."""
@@ -32,69 +36,39 @@ class TestChatServiceInit:
 class TestDetectAppointmentChanges:
     """Tests for _detect_appointment_changes method."""
 
-    def test_detect_booked_successfully(self, chat_service: ChatService) -> None:
-        """Test detection of 'booked successfully' in response."""
-        result = chat_service._detect_appointment_changes(
-            "Your meeting has been booked successfully.",
-            [],
-        )
-        assert result is True
-
-    def test_detect_has_been_canceled(self, chat_service: ChatService) -> None:
-        """Test detection of 'has been canceled' in response."""
-        result = chat_service._detect_appointment_changes(
-            "Your appointment has been canceled.",
-            [],
-        )
-        assert result is True
-
-    def test_detect_scheduled_for(self, chat_service: ChatService) -> None:
-        """Test detection of 'scheduled for' in response."""
-        result = chat_service._detect_appointment_changes(
-            "I've scheduled for tomorrow at 2pm.",
-            [],
-        )
-        assert result is True
-
-    def test_detect_appointment_created(self, chat_service: ChatService) -> None:
-        """Test detection of 'appointment created' in response."""
-        result = chat_service._detect_appointment_changes(
-            "Your appointment created successfully.",
-            [],
-        )
-        assert result is True
-
-    def test_detect_appointment_cancelled(self, chat_service: ChatService) -> None:
-        """Test detection of 'appointment cancelled' in response."""
-        result = chat_service._detect_appointment_changes(
-            "Your appointment cancelled per your request.",
-            [],
-        )
-        assert result is True
-
-    def test_detect_has_been_canceled_alt(self, chat_service: ChatService) -> None:
-        """Test detection of 'has been canceled' in response."""
-        result = chat_service._detect_appointment_changes(
-            "The meeting has been canceled.",
-            [],
-        )
-        assert result is True
-
-    def test_no_changes_detected(self, chat_service: ChatService) -> None:
-        """Test when no appointment changes are detected."""
-        result = chat_service._detect_appointment_changes(
-            "I can help you check your availability.",
-            [],
-        )
-        assert result is False
-
-    def test_case_insensitive(self, chat_service: ChatService) -> None:
-        """Test that detection is case-insensitive."""
-        result = chat_service._detect_appointment_changes(
-            "YOUR MEETING HAS BEEN BOOKED SUCCESSFULLY!",
-            [],
-        )
-        assert result is True
+    @pytest.mark.parametrize(
+        ("response", "expected"),
+        [
+            ("Your meeting has been booked successfully.", True),
+            ("Your appointment has been canceled.", True),
+            ("I've scheduled for tomorrow at 2pm.", True),
+            ("Your appointment created successfully.", True),
+            ("Your appointment cancelled per your request.", True),
+            ("The meeting has been canceled.", True),
+            ("YOUR MEETING HAS BEEN BOOKED SUCCESSFULLY!", True),
+            ("I've booked your dentist visit.", True),
+            ("I can help you check your availability.", False),
+        ],
+        ids=[
+            "booked_successfully",
+            "has_been_canceled",
+            "scheduled_for",
+            "appointment_created",
+            "appointment_cancelled",
+            "has_been_canceled_alt",
+            "case_insensitive",
+            "ive_booked",
+            "no_changes",
+        ],
+    )
+    def test_detect_phrases(
+        self,
+        chat_service: ChatService,
+        response: str,
+        expected: bool,
+    ) -> None:
+        """Test phrase detection in the response text."""
+        assert chat_service._detect_appointment_changes(response, []) is expected
 
     def test_detect_from_tool_results_success(self, chat_service: ChatService) -> None:
         """Test detection from successful tool results in history."""
@@ -105,7 +79,7 @@ class TestDetectAppointmentChanges:
                     {
                         "type": "tool_result",
                         "tool_use_id": "tool-123",
-                        "content": json.dumps({"success": True}),
+                        "content": SUCCESS_JSON,
                     }
                 ],
             }
@@ -125,7 +99,7 @@ class TestDetectAppointmentChanges:
                     {
                         "type": "tool_result",
                         "tool_use_id": "tool-123",
-                        "content": json.dumps({"success": False}),
+                        "content": FAILURE_JSON,
                     }
                 ],
             }
@@ -156,6 +130,26 @@ class TestDetectAppointmentChanges:
         )
         assert result is False
 
+    def test_handle_non_object_json_in_tool_results(self, chat_service: ChatService) -> None:
+        """Test that JSON tool results that are not objects are ignored."""
+        history: list[dict[str, Any]] = [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": "tool-123",
+                        "content": json.dumps([{"success": True}]),
+                    }
+                ],
+            }
+        ]
+        result = chat_service._detect_appointment_changes(
+            "Here are the results.",
+            history,
+        )
+        assert result is False
+
     def test_handle_non_list_content(self, chat_service: ChatService) -> None:
         """Test handling of non-list content in history."""
         history: list[dict[str, Any]] = [
@@ -174,40 +168,60 @@ class TestDetectAppointmentChanges:
 class TestProcessMessage:
     """Tests for process_message method."""
 
-    @pytest.mark.asyncio
-    async def test_process_message_new_session(
+    @pytest.mark.parametrize(
+        ("message", "response", "expected_changed"),
+        [
+            (
+                "Hello, I need to book a meeting.",
+                "I can help you with scheduling.",
+                False,
+            ),
+            (
+                "Book a meeting for tomorrow at 2pm",
+                "Your meeting has been booked successfully for tomorrow at 2pm.",
+                True,
+            ),
+        ],
+        ids=["new_session", "detects_booking"],
+    )
+    async def test_process_message(
         self,
         chat_service: ChatService,
         mock_scheduling_agent: MockSchedulingAgent,
+        message: str,
+        response: str,
+        expected_changed: bool,
     ) -> None:
-        """Test processing message with new session."""
-        mock_scheduling_agent.set_response("I can help you with scheduling.")
+        """Test processing a message in a new session."""
+        mock_scheduling_agent.set_response(response)
 
-        response, changed = await chat_service.process_message(
+        result, changed = await chat_service.process_message(
             session_id="new-session",
-            message="Hello, I need to book a meeting.",
+            message=message,
         )
 
-        assert response == "I can help you with scheduling."
-        assert changed is False
+        assert result == response
+        assert changed is expected_changed
         assert "new-session" in chat_service._sessions
 
-    @pytest.mark.asyncio
     async def test_process_message_existing_session(
         self,
         chat_service: ChatService,
         mock_scheduling_agent: MockSchedulingAgent,
     ) -> None:
         """Test processing message with existing session."""
+        mock_scheduling_agent.set_responses(
+            "Hello! How can I help?",
+            "I'll check your calendar.",
+        )
+
         # First message
-        mock_scheduling_agent.set_response("Hello! How can I help?")
         await chat_service.process_message(
             session_id="existing-session",
             message="Hi",
         )
 
         # Second message
-        mock_scheduling_agent.set_response("I'll check your calendar.")
         response, _ = await chat_service.process_message(
             session_id="existing-session",
             message="What's my schedule?",
@@ -218,24 +232,6 @@ class TestProcessMessage:
         history = chat_service._sessions.get("existing-session", [])
         assert len(history) > 0
 
-    @pytest.mark.asyncio
-    async def test_process_message_detects_booking(
-        self,
-        chat_service: ChatService,
-        mock_scheduling_agent: MockSchedulingAgent,
-    ) -> None:
-        """Test that booking is detected in response."""
-        mock_scheduling_agent.set_response(
-            "Your meeting has been booked successfully for tomorrow at 2pm."
-        )
-
-        response, changed = await chat_service.process_message(
-            session_id="test-session",
-            message="Book a meeting for tomorrow at 2pm",
-        )
-
-        assert changed is True
-
 
 class TestGetHistory:
     """Tests for get_history method."""
@@ -245,7 +241,6 @@ class TestGetHistory:
         history = chat_service.get_history("non-existent")
         assert history == []
 
-    @pytest.mark.asyncio
     async def test_get_history_with_messages(
         self,
         chat_service: ChatService,
@@ -264,7 +259,6 @@ class TestGetHistory:
 class TestClearHistory:
     """Tests for clear_history method."""
 
-    @pytest.mark.asyncio
     async def test_clear_history(
         self,
         chat_service: ChatService,
@@ -295,7 +289,6 @@ class TestFormatHistoryForClient:
         formatted = chat_service.format_history_for_client("non-existent")
         assert formatted == []
 
-    @pytest.mark.asyncio
     async def test_format_simple_history(
         self,
         chat_service: ChatService,
@@ -331,8 +324,7 @@ class TestFormatHistoryForClient:
         formatted = chat_service.format_history_for_client("test-session")
         assert len(formatted) == 1
         assert formatted[0]["role"] == "assistant"
-        assert "Part 1" in formatted[0]["content"]
-        assert "Part 2" in formatted[0]["content"]
+        assert formatted[0]["content"] == "Part 1 Part 2"
 
     def test_format_filters_empty_content(self, chat_service: ChatService) -> None:
         """Test that empty content is filtered out."""
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from typing import Any
 
 import pytest
 
+from agent_demos.demos.appointment_booking.websocket import manager as manager_module
 from agent_demos.demos.appointment_booking.websocket.manager import ConnectionManager
+from tests.conftest import MockWebSocket
 
 
 class TestConnectionManagerInit:
@@ -23,38 +26,32 @@ class TestConnectionManagerInit:
 class TestConnect:
     """Tests for connect method."""
 
-    @pytest.mark.asyncio
     async def test_connect_new_session(self) -> None:
         """Test connecting with new session."""
         manager = ConnectionManager()
-        websocket = MagicMock()
-        websocket.accept = AsyncMock()
+        websocket = MockWebSocket()
 
         session_id = await manager.connect(websocket)
 
         assert len(session_id) > 0
         assert session_id in manager._connections
         assert session_id in manager._session_history
-        websocket.accept.assert_called_once()
+        assert websocket.accepted
 
-    @pytest.mark.asyncio
     async def test_connect_with_session_id(self) -> None:
         """Test connecting with provided session ID."""
         manager = ConnectionManager()
-        websocket = MagicMock()
-        websocket.accept = AsyncMock()
+        websocket = MockWebSocket()
 
         session_id = await manager.connect(websocket, "test-session")
 
         assert session_id == "test-session"
         assert "test-session" in manager._connections
 
-    @pytest.mark.asyncio
     async def test_connect_preserves_history(self) -> None:
         """Test that reconnecting preserves history."""
         manager = ConnectionManager()
-        websocket1 = MagicMock()
-        websocket1.accept = AsyncMock()
+        websocket1 = MockWebSocket()
 
         # First connection
         session_id = await manager.connect(websocket1, "test-session")
@@ -64,8 +61,7 @@ class TestConnect:
         manager.disconnect(session_id)
 
         # Reconnect
-        websocket2 = MagicMock()
-        websocket2.accept = AsyncMock()
+        websocket2 = MockWebSocket()
         await manager.connect(websocket2, "test-session")
 
         # History should be preserved
@@ -76,12 +72,10 @@ class TestConnect:
 class TestDisconnect:
     """Tests for disconnect method."""
 
-    @pytest.mark.asyncio
     async def test_disconnect(self) -> None:
         """Test disconnecting a session."""
         manager = ConnectionManager()
-        websocket = MagicMock()
-        websocket.accept = AsyncMock()
+        websocket = MockWebSocket()
 
         session_id = await manager.connect(websocket, "test-session")
         manager.disconnect(session_id)
@@ -98,30 +92,25 @@ class TestDisconnect:
 class TestDisconnectAll:
     """Tests for disconnect_all method."""
 
-    @pytest.mark.asyncio
     async def test_disconnect_all(self) -> None:
         """Test disconnecting all sessions."""
         manager = ConnectionManager()
 
         # Connect multiple
-        for i in range(3):
-            ws = MagicMock()
-            ws.accept = AsyncMock()
-            ws.close = AsyncMock()
-            await manager.connect(ws, f"session-{i}")
+        websockets = [MockWebSocket() for _ in range(3)]
+        await asyncio.gather(*(
+            manager.connect(ws, f"session-{i}") for i, ws in enumerate(websockets)
+        ))
 
         await manager.disconnect_all()
 
         assert manager.active_connections == 0
 
-    @pytest.mark.asyncio
     async def test_disconnect_all_handles_errors(self) -> None:
         """Test disconnect_all handles close errors gracefully."""
         manager = ConnectionManager()
 
-        ws = MagicMock()
-        ws.accept = AsyncMock()
-        ws.close = AsyncMock(side_effect=Exception("Close failed"))
+        ws = MockWebSocket(close_error=Exception("Close failed"))
         await manager.connect(ws, "test-session")
 
         # Should not raise
@@ -137,12 +126,10 @@ class TestHistory:
         history = manager.get_history("nonexistent")
         assert history == []
 
-    @pytest.mark.asyncio
     async def test_add_to_history(self) -> None:
         """Test adding to history."""
         manager = ConnectionManager()
-        ws = MagicMock()
-        ws.accept = AsyncMock()
+        ws = MockWebSocket()
         await manager.connect(ws, "test-session")
 
         manager.add_to_history("test-session", {"role": "user", "content": "Hi"})
@@ -159,6 +146,16 @@ class TestHistory:
         history = manager.get_history("new-session")
         assert len(history) == 1
 
+    def test_history_is_bounded(self) -> None:
+        """Test that the oldest messages are dropped past the history cap."""
+        manager = ConnectionManager()
+        for i in range(ConnectionManager.MAX_HISTORY_MESSAGES + 1):
+            manager.add_to_history("test-session", {"role": "user", "content": str(i)})
+
+        history = manager.get_history("test-session")
+        assert len(history) == ConnectionManager.MAX_HISTORY_MESSAGES
+        assert history[0]["content"] == "1"
+
     def test_clear_history(self) -> None:
         """Test clearing history."""
         manager = ConnectionManager()
@@ -172,34 +169,27 @@ class TestHistory:
 class TestSendMessage:
     """Tests for send_message method."""
 
-    @pytest.mark.asyncio
     async def test_send_message_success(self) -> None:
         """Test sending message to connected client."""
         manager = ConnectionManager()
-        ws = MagicMock()
-        ws.accept = AsyncMock()
-        ws.send_json = AsyncMock()
+        ws = MockWebSocket()
 
         await manager.connect(ws, "test-session")
         result = await manager.send_message("test-session", {"type": "test"})
 
         assert result is True
-        ws.send_json.assert_called_once_with({"type": "test"})
+        assert ws.sent == [{"type": "test"}]
 
-    @pytest.mark.asyncio
     async def test_send_message_not_found(self) -> None:
         """Test sending message to non-existent session."""
         manager = ConnectionManager()
         result = await manager.send_message("nonexistent", {"type": "test"})
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_send_message_error_disconnects(self) -> None:
         """Test that send errors disconnect the client."""
         manager = ConnectionManager()
-        ws = MagicMock()
-        ws.accept = AsyncMock()
-        ws.send_json = AsyncMock(side_effect=Exception("Send failed"))
+        ws = MockWebSocket(send_error=Exception("Send failed"))
 
         await manager.connect(ws, "test-session")
         result = await manager.send_message("test-session", {"type": "test"})
@@ -211,45 +201,57 @@ class TestSendMessage:
 class TestBroadcast:
     """Tests for broadcast method."""
 
-    @pytest.mark.asyncio
     async def test_broadcast(self) -> None:
         """Test broadcasting to all clients."""
         manager = ConnectionManager()
 
-        websockets = []
-        for i in range(3):
-            ws = MagicMock()
-            ws.accept = AsyncMock()
-            ws.send_json = AsyncMock()
+        websockets = [MockWebSocket() for _ in range(3)]
+        await asyncio.gather(*(
+            manager.connect(ws, f"session-{i}") for i, ws in enumerate(websockets)
+        ))
+
+        await manager.broadcast({"type": "notification"})
+
+        for ws in websockets:
+            assert ws.sent == [{"type": "notification"}]
+
+    async def test_broadcast_encodes_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a broadcast encodes the message once for all clients."""
+        encoded: list[dict[str, Any]] = []
+
+        def encode_json(message: dict[str, Any]) -> str:
+            encoded.append(message)
+            return '{"type":"notification"}'
+
+        monkeypatch.setattr(manager_module, "encode_json", encode_json)
+        manager = ConnectionManager()
+
+        websockets = [MockWebSocket() for _ in range(3)]
+        for i, ws in enumerate(websockets):
             await manager.connect(ws, f"session-{i}")
-            websockets.append(ws)
 
         await manager.broadcast({"type": "notification"})
 
+        assert encoded == [{"type": "notification"}]
         for ws in websockets:
-            ws.send_json.assert_called_once_with({"type": "notification"})
+            assert ws.sent == [{"type": "notification"}]
 
-    @pytest.mark.asyncio
     async def test_broadcast_handles_errors(self) -> None:
         """Test broadcast handles individual client errors."""
         manager = ConnectionManager()
 
         # Good client
-        ws1 = MagicMock()
-        ws1.accept = AsyncMock()
-        ws1.send_json = AsyncMock()
+        ws1 = MockWebSocket()
         await manager.connect(ws1, "session-1")
 
         # Bad client
-        ws2 = MagicMock()
-        ws2.accept = AsyncMock()
-        ws2.send_json = AsyncMock(side_effect=Exception("Send failed"))
+        ws2 = MockWebSocket(send_error=Exception("Send failed"))
         await manager.connect(ws2, "session-2")
 
         await manager.broadcast({"type": "notification"})
 
         # Good client should have received message
-        ws1.send_json.assert_called_once()
+        assert len(ws1.sent) == 1
         # Bad client should be disconnected
         assert "session-2" not in manager._connections
         assert manager.active_connections == 1
@@ -258,15 +260,13 @@ class TestBroadcast:
 class TestActiveConnections:
     """Tests for active_connections property."""
 
-    @pytest.mark.asyncio
     async def test_active_connections(self) -> None:
         """Test active connections count."""
         manager = ConnectionManager()
         assert manager.active_connections == 0
 
         for i in range(5):
-            ws = MagicMock()
-            ws.accept = AsyncMock()
+            ws = MockWebSocket()
             await manager.connect(ws, f"session-{i}")
             assert manager.active_connections == i + 1
 
@@ -1,6 +1,6 @@
 """Unit tests for Pydantic models."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from pydantic import ValidationError
@@ -19,6 +19,9 @@ from agent_demos.demos.appointment_booking.models import (
     WebSocketMessage,
 )
 
+# Fixed instant for tests that only need some valid start time
+NOW = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
 
 class TestAppointmentStatus:
     """Tests for AppointmentStatus enum."""
@@ -41,41 +44,49 @@ class TestAppointment:
 
     def test_create_appointment(self) -> None:
         """Test creating an appointment with required fields."""
-        now = datetime.utcnow()
+        now = NOW
+        end = now + timedelta(hours=1)
         appointment = Appointment(
             id="test-123",
             title="Test Meeting",
             start=now,
-            end=now + timedelta(hours=1),
+            end=end,
         )
-        assert appointment.id == "test-123"
-        assert appointment.title == "Test Meeting"
-        assert appointment.start == now
-        assert appointment.end == now + timedelta(hours=1)
-        assert appointment.attendees == []
-        assert appointment.description is None
-        assert appointment.location is None
-        assert appointment.status == AppointmentStatus.CONFIRMED
+        assert appointment.model_dump() == {
+            "id": "test-123",
+            "title": "Test Meeting",
+            "start": now,
+            "end": end,
+            "attendees": [],
+            "description": None,
+            "location": None,
+            "status": AppointmentStatus.CONFIRMED,
+        }
 
     def test_create_appointment_with_all_fields(self) -> None:
         """Test creating an appointment with all fields."""
-        now = datetime.utcnow()
+        now = NOW
+        end = now + timedelta(hours=2)
         appointment = Appointment(
             id="test-456",
             title="Full Meeting",
             start=now,
-            end=now + timedelta(hours=2),
+            end=end,
             attendees=["alice@example.com", "bob@example.com"],
             description="A test meeting",
             location="Conference Room A",
             status=AppointmentStatus.PENDING,
         )
-        assert appointment.id == "test-456"
-        assert len(appointment.attendees) == 2
-        assert "alice@example.com" in appointment.attendees
-        assert appointment.description == "A test meeting"
-        assert appointment.location == "Conference Room A"
-        assert appointment.status == AppointmentStatus.PENDING
+        assert appointment.model_dump() == {
+            "id": "test-456",
+            "title": "Full Meeting",
+            "start": now,
+            "end": end,
+            "attendees": ["alice@example.com", "bob@example.com"],
+            "description": "A test meeting",
+            "location": "Conference Room A",
+            "status": AppointmentStatus.PENDING,
+        }
 
     def test_appointment_json_serialization(self) -> None:
         """Test JSON serialization of appointment."""
@@ -107,31 +118,42 @@ class TestAppointmentCreate:
 
     def test_create_appointment_request(self) -> None:
         """Test creating an appointment create request."""
-        now = datetime.utcnow()
+        now = NOW
+        end = now + timedelta(hours=1)
         request = AppointmentCreate(
             title="New Meeting",
             start=now,
-            end=now + timedelta(hours=1),
+            end=end,
         )
-        assert request.title == "New Meeting"
-        assert request.attendees == []
-        assert request.description is None
-        assert request.location is None
+        assert request.model_dump() == {
+            "title": "New Meeting",
+            "start": now,
+            "end": end,
+            "attendees": [],
+            "description": None,
+            "location": None,
+        }
 
     def test_create_appointment_request_with_optional_fields(self) -> None:
         """Test creating request with optional fields."""
-        now = datetime.utcnow()
+        now = NOW
+        end = now + timedelta(hours=1)
         request = AppointmentCreate(
             title="Full Meeting",
             start=now,
-            end=now + timedelta(hours=1),
+            end=end,
             attendees=["user@example.com"],
             description="Important meeting",
             location="Room 101",
         )
-        assert len(request.attendees) == 1
-        assert request.description == "Important meeting"
-        assert request.location == "Room 101"
+        assert request.model_dump() == {
+            "title": "Full Meeting",
+            "start": now,
+            "end": end,
+            "attendees": ["user@example.com"],
+            "description": "Important meeting",
+            "location": "Room 101",
+        }
 
 
 class TestTimeSlot:
@@ -139,18 +161,20 @@ class TestTimeSlot:
 
     def test_create_time_slot(self) -> None:
         """Test creating a time slot."""
-        now = datetime.utcnow()
+        now = NOW
+        end = now + timedelta(minutes=30)
         slot = TimeSlot(
             start=now,
-            end=now + timedelta(minutes=30),
+            end=end,
         )
         assert slot.start == now
-        assert slot.end == now + timedelta(minutes=30)
+        assert slot.end == end
 
     def test_time_slot_duration(self) -> None:
         """Test time slot duration calculation."""
-        now = datetime.utcnow()
-        slot = TimeSlot(
+        now = NOW
+        # Only the arithmetic is under test, so skip validation
+        slot = TimeSlot.model_construct(
             start=now,
             end=now + timedelta(hours=1),
         )
@@ -163,7 +187,7 @@ class TestAvailabilityRequest:
 
     def test_create_availability_request(self) -> None:
         """Test creating an availability request."""
-        now = datetime.utcnow()
+        now = NOW
         request = AvailabilityRequest(
             start=now,
             end=now + timedelta(days=1),
@@ -172,7 +196,7 @@ class TestAvailabilityRequest:
 
     def test_custom_slot_duration(self) -> None:
         """Test custom slot duration."""
-        now = datetime.utcnow()
+        now = NOW
         request = AvailabilityRequest(
             start=now,
             end=now + timedelta(days=1),
@@ -186,10 +210,13 @@ class TestAvailabilityResponse:
 
     def test_create_availability_response(self) -> None:
         """Test creating an availability response."""
-        now = datetime.utcnow()
+        now = NOW
         slots = [
-            TimeSlot(start=now, end=now + timedelta(minutes=30)),
-            TimeSlot(start=now + timedelta(hours=1), end=now + timedelta(hours=1, minutes=30)),
+            TimeSlot.model_construct(start=now, end=now + timedelta(minutes=30)),
+            TimeSlot.model_construct(
+                start=now + timedelta(hours=1),
+                end=now + timedelta(hours=1, minutes=30),
+            ),
         ]
         response = AvailabilityResponse(
             available_slots=slots,
@@ -220,6 +247,7 @@ class TestChatMessage:
         assert message.role == "user"
         assert message.content == "Hello, I need help with scheduling."
         assert isinstance(message.timestamp, datetime)
+        assert message.timestamp.tzinfo is timezone.utc
 
     def test_create_assistant_message(self) -> None:
         """Test creating an assistant chat message."""
@@ -278,9 +306,11 @@ class TestChatResponse:
             message="I can help!",
             session_id="session-123",
         )
-        assert response.message == "I can help!"
-        assert response.session_id == "session-123"
-        assert response.appointments_changed is False  # Default
+        assert response.model_dump() == {
+            "message": "I can help!",
+            "session_id": "session-123",
+            "appointments_changed": False,  # Default
+        }
 
     def test_chat_response_with_changes(self) -> None:
         """Test chat response indicating appointment changes."""
@@ -332,17 +362,19 @@ class TestNotificationMessage:
         assert notification.event == "appointment_created"
         assert notification.data["id"] == "123"
 
-    def test_different_event_types(self) -> None:
-        """Test different notification event types."""
-        events = [
+    @pytest.mark.parametrize(
+        "event",
+        [
             "appointment_created",
             "appointment_cancelled",
             "appointment_updated",
             "calendar_synced",
-        ]
-        for event in events:
-            notification = NotificationMessage(
-                event=event,
-                data={},
-            )
-            assert notification.event == event
+        ],
+    )
+    def test_different_event_types(self, event: str) -> None:
+        """Test different notification event types."""
+        notification = NotificationMessage(
+            event=event,
+            data={},
+        )
+        assert notification.event == event
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-import time
+from collections.abc import Callable, Iterator
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from agent_demos.demos.appointment_booking import rate_limit
 from agent_demos.demos.appointment_booking.rate_limit import (
     RateLimitConfig,
     RateLimiter,
@@ -17,6 +20,67 @@ from agent_demos.demos.appointment_booking.rate_limit import (
 )
 
 
+class MockClock:
+    """Manually advanced stand-in for ``time.time``."""
+
+    def __init__(self, now: float = 1000.0) -> None:
+        """Start the clock at a fixed time."""
+        self.now = now
+
+    def __call__(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward."""
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock(monkeypatch: pytest.MonkeyPatch) -> MockClock:
+    """Give the rate limit module a controllable clock.
+
+    Only the module's own ``time`` reference is replaced, so ``time.time``
+    stays real for everything else in the process.
+    """
+    clock = MockClock()
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(time=clock))
+    return clock
+
+
+@pytest.fixture(scope="module")
+def limiter() -> RateLimiter:
+    """Create a small-burst rate limiter shared by this module."""
+    return RateLimiter(
+        RateLimitConfig(
+            http_requests_per_minute=60,
+            http_burst_limit=3,
+            ws_messages_per_minute=30,
+            ws_burst_limit=2,
+        )
+    )
+
+
+@pytest.fixture(scope="module")
+def disabled_limiter() -> RateLimiter:
+    """Create a disabled rate limiter with bursts that would otherwise block."""
+    return RateLimiter(
+        RateLimitConfig(
+            enabled=False,
+            http_burst_limit=1,
+            ws_burst_limit=1,
+        )
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_limiters(limiter: RateLimiter, disabled_limiter: RateLimiter) -> Iterator[None]:
+    """Empty the shared limiters' buckets after each test."""
+    yield
+    limiter.reset()
+    disabled_limiter.reset()
+
+
 class TestTokenBucket:
     """Tests for TokenBucket."""
 
@@ -41,28 +105,28 @@ class TestTokenBucket:
     def test_consume_fails_when_empty(self) -> None:
         """Test consumption fails when not enough tokens."""
         bucket = TokenBucket(capacity=2, refill_rate=1.0)
-        assert bucket.consume(1) is True
-        assert bucket.consume(1) is True
+        assert bucket.consume(2) is True
         assert bucket.consume(1) is False
 
-    def test_refill_over_time(self) -> None:
+    def test_refill_over_time(self, fake_clock: MockClock) -> None:
         """Test tokens refill over time."""
-        bucket = TokenBucket(capacity=10, refill_rate=10.0)  # 10 tokens/second
+        # 10 tokens/second
+        bucket = TokenBucket(capacity=10, refill_rate=10.0, last_refill=fake_clock())
         bucket.tokens = 0.0
-        bucket.last_refill = time.time() - 0.5  # Half second ago
+        fake_clock.advance(0.5)
 
-        # Should have refilled ~5 tokens
+        # Refilled 5 tokens, then consumed 1
         result = bucket.consume(1)
         assert result is True
-        assert bucket.tokens >= 3.5  # Allow some variance
+        assert bucket.tokens == 4.0
 
-    def test_refill_caps_at_capacity(self) -> None:
+    def test_refill_caps_at_capacity(self, fake_clock: MockClock) -> None:
         """Test refill doesn't exceed capacity."""
-        bucket = TokenBucket(capacity=10, refill_rate=100.0)
-        bucket.last_refill = time.time() - 1.0  # 1 second ago
+        bucket = TokenBucket(capacity=10, refill_rate=100.0, last_refill=fake_clock())
+        fake_clock.advance(1.0)
 
         bucket.consume(1)
-        assert bucket.tokens <= bucket.capacity
+        assert bucket.tokens == bucket.capacity - 1
 
     def test_time_until_available(self) -> None:
         """Test calculating time until tokens available."""
@@ -70,7 +134,7 @@ class TestTokenBucket:
         bucket.tokens = 0.0
 
         wait_time = bucket.time_until_available(1)
-        assert 0.4 <= wait_time <= 0.6  # About 0.5 seconds
+        assert wait_time == 0.5
 
     def test_time_until_available_immediate(self) -> None:
         """Test time is 0 when tokens available."""
@@ -97,23 +161,16 @@ class TestRateLimiter:
         assert limiter.config.http_requests_per_minute == 120
         assert limiter.config.http_burst_limit == 20
 
-    def test_check_http_allowed(self) -> None:
+    def test_check_http_allowed(self, limiter: RateLimiter) -> None:
         """Test HTTP request is allowed."""
-        limiter = RateLimiter(RateLimitConfig(http_burst_limit=10))
         allowed, retry_after = limiter.check_http("192.168.1.1")
         assert allowed is True
         assert retry_after == 0.0
 
-    def test_check_http_rate_limited(self) -> None:
+    def test_check_http_rate_limited(self, limiter: RateLimiter) -> None:
         """Test HTTP request is rate limited after burst."""
-        config = RateLimitConfig(
-            http_burst_limit=3,
-            http_requests_per_minute=60,
-        )
-        limiter = RateLimiter(config)
-
         # Exhaust burst limit
-        for _ in range(3):
+        for _ in range(limiter.config.http_burst_limit):
             allowed, _ = limiter.check_http("192.168.1.1")
             assert allowed is True
 
@@ -122,14 +179,10 @@ class TestRateLimiter:
         assert allowed is False
         assert retry_after > 0
 
-    def test_check_http_different_clients(self) -> None:
+    def test_check_http_different_clients(self, limiter: RateLimiter) -> None:
         """Test different clients have separate rate limits."""
-        config = RateLimitConfig(http_burst_limit=2)
-        limiter = RateLimiter(config)
-
         # Client 1 exhausts limit
-        limiter.check_http("client1")
-        limiter.check_http("client1")
+        limiter._http_buckets["client1"].consume(limiter.config.http_burst_limit)
         allowed, _ = limiter.check_http("client1")
         assert allowed is False
 
@@ -137,23 +190,16 @@ class TestRateLimiter:
         allowed, _ = limiter.check_http("client2")
         assert allowed is True
 
-    def test_check_ws_allowed(self) -> None:
+    def test_check_ws_allowed(self, limiter: RateLimiter) -> None:
         """Test WebSocket message is allowed."""
-        limiter = RateLimiter(RateLimitConfig(ws_burst_limit=5))
         allowed, retry_after = limiter.check_ws("session-1")
         assert allowed is True
         assert retry_after == 0.0
 
-    def test_check_ws_rate_limited(self) -> None:
+    def test_check_ws_rate_limited(self, limiter: RateLimiter) -> None:
         """Test WebSocket message is rate limited after burst."""
-        config = RateLimitConfig(
-            ws_burst_limit=2,
-            ws_messages_per_minute=30,
-        )
-        limiter = RateLimiter(config)
-
         # Exhaust burst limit
-        for _ in range(2):
+        for _ in range(limiter.config.ws_burst_limit):
             allowed, _ = limiter.check_ws("session-1")
             assert allowed is True
 
@@ -162,31 +208,16 @@ class TestRateLimiter:
         assert allowed is False
         assert retry_after > 0
 
-    def test_disabled_rate_limiting(self) -> None:
+    def test_disabled_rate_limiting(self, disabled_limiter: RateLimiter) -> None:
         """Test rate limiting can be disabled."""
-        config = RateLimitConfig(
-            enabled=False,
-            http_burst_limit=1,
-            ws_burst_limit=1,
-        )
-        limiter = RateLimiter(config)
-
-        # Should always be allowed when disabled
-        for _ in range(100):
-            allowed, _ = limiter.check_http("client")
-            assert allowed is True
-
-            allowed, _ = limiter.check_ws("session")
-            assert allowed is True
+        # Repeated calls on one key would exceed the burst of 1 if enabled
+        assert all(disabled_limiter.check_http("client")[0] for _ in range(10))
+        assert all(disabled_limiter.check_ws("session")[0] for _ in range(10))
 
-    def test_reset_specific_key(self) -> None:
+    def test_reset_specific_key(self, limiter: RateLimiter) -> None:
         """Test resetting rate limit for specific key."""
-        config = RateLimitConfig(http_burst_limit=2)
-        limiter = RateLimiter(config)
-
         # Exhaust limit
-        limiter.check_http("client1")
-        limiter.check_http("client1")
+        limiter._http_buckets["client1"].consume(limiter.config.http_burst_limit)
 
         # Reset
         limiter.reset("client1")
@@ -195,15 +226,12 @@ class TestRateLimiter:
         allowed, _ = limiter.check_http("client1")
         assert allowed is True
 
-    def test_reset_all(self) -> None:
+    def test_reset_all(self, limiter: RateLimiter) -> None:
         """Test resetting all rate limits."""
-        config = RateLimitConfig(http_burst_limit=1, ws_burst_limit=1)
-        limiter = RateLimiter(config)
-
         # Exhaust limits for multiple clients
-        limiter.check_http("client1")
-        limiter.check_http("client2")
-        limiter.check_ws("session1")
+        limiter._http_buckets["client1"].consume(limiter.config.http_burst_limit)
+        limiter._http_buckets["client2"].consume(limiter.config.http_burst_limit)
+        limiter._ws_buckets["session1"].consume(limiter.config.ws_burst_limit)
 
         # Reset all
         limiter.reset()
@@ -217,109 +245,67 @@ class TestRateLimiter:
         assert allowed is True
 
 
+@pytest.mark.parametrize(
+    "getter",
+    [get_client_ip, get_ws_client_ip],
+    ids=["http", "ws"],
+)
 class TestGetClientIp:
-    """Tests for get_client_ip."""
-
-    def test_direct_client(self) -> None:
-        """Test getting IP from direct client."""
-        request = MagicMock()
-        request.headers = {}
-        request.client.host = "192.168.1.1"
-
-        ip = get_client_ip(request)
-        assert ip == "192.168.1.1"
-
-    def test_x_forwarded_for(self) -> None:
-        """Test getting IP from X-Forwarded-For header."""
-        request = MagicMock()
-        request.headers = {"x-forwarded-for": "10.0.0.1, 10.0.0.2"}
-        request.client.host = "192.168.1.1"
-
-        ip = get_client_ip(request)
-        assert ip == "10.0.0.1"
-
-    def test_x_real_ip(self) -> None:
-        """Test getting IP from X-Real-IP header."""
-        request = MagicMock()
-        request.headers = {"x-real-ip": "10.0.0.1"}
-        request.client.host = "192.168.1.1"
-
-        ip = get_client_ip(request)
-        assert ip == "10.0.0.1"
-
-    def test_x_forwarded_for_priority(self) -> None:
-        """Test X-Forwarded-For takes priority over X-Real-IP."""
-        request = MagicMock()
-        request.headers = {
-            "x-forwarded-for": "10.0.0.1",
-            "x-real-ip": "10.0.0.2",
-        }
-        request.client.host = "192.168.1.1"
-
-        ip = get_client_ip(request)
-        assert ip == "10.0.0.1"
-
-    def test_no_client(self) -> None:
-        """Test fallback when no client info."""
-        request = MagicMock()
-        request.headers = {}
-        request.client = None
-
-        ip = get_client_ip(request)
-        assert ip == "unknown"
-
-
-class TestGetWsClientIp:
-    """Tests for get_ws_client_ip."""
-
-    def test_direct_client(self) -> None:
-        """Test getting IP from direct WebSocket client."""
-        websocket = MagicMock()
-        websocket.headers = {}
-        websocket.client.host = "192.168.1.1"
+    """Tests for get_client_ip and get_ws_client_ip."""
+
+    @pytest.mark.parametrize(
+        ("headers", "expected"),
+        [
+            ({}, "192.168.1.1"),
+            ({"x-forwarded-for": "10.0.0.1, 10.0.0.2"}, "10.0.0.1"),
+            ({"x-real-ip": "10.0.0.1"}, "10.0.0.1"),
+            ({"x-forwarded-for": "10.0.0.1", "x-real-ip": "10.0.0.2"}, "10.0.0.1"),
+        ],
+        ids=["direct_client", "x_forwarded_for", "x_real_ip", "x_forwarded_for_priority"],
+    )
+    def test_client_ip(
+        self,
+        getter: Callable[[Any], str],
+        headers: dict[str, str],
+        expected: str,
+    ) -> None:
+        """Test getting IP from proxy headers or the direct client."""
+        connection = SimpleNamespace(
+            headers=headers,
+            client=SimpleNamespace(host="192.168.1.1"),
+        )
 
-        ip = get_ws_client_ip(websocket)
-        assert ip == "192.168.1.1"
+        assert getter(connection) == expected
 
-    def test_x_forwarded_for(self) -> None:
-        """Test getting IP from X-Forwarded-For header."""
-        websocket = MagicMock()
-        websocket.headers = {"x-forwarded-for": "10.0.0.1, 10.0.0.2"}
-        websocket.client.host = "192.168.1.1"
+    def test_no_client(self, getter: Callable[[Any], str]) -> None:
+        """Test fallback when no client info."""
+        connection = SimpleNamespace(headers={}, client=None)
 
-        ip = get_ws_client_ip(websocket)
-        assert ip == "10.0.0.1"
+        assert getter(connection) == "unknown"
 
 
 class TestCheckWsRateLimit:
     """Tests for check_ws_rate_limit helper."""
 
-    @pytest.mark.asyncio
-    async def test_allowed(self) -> None:
+    async def test_allowed(self, limiter: RateLimiter) -> None:
         """Test message is allowed."""
         websocket = MagicMock()
         websocket.send_json = AsyncMock()
 
-        limiter = RateLimiter(RateLimitConfig(ws_burst_limit=5))
-
         result = await check_ws_rate_limit(websocket, limiter, "session-1")
 
         assert result is True
         websocket.send_json.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_rate_limited(self) -> None:
+    async def test_rate_limited(self, limiter: RateLimiter) -> None:
         """Test message is rate limited."""
         websocket = MagicMock()
         websocket.send_json = AsyncMock()
 
-        config = RateLimitConfig(ws_burst_limit=1, ws_messages_per_minute=30)
-        limiter = RateLimiter(config)
-
-        # First message allowed
-        await check_ws_rate_limit(websocket, limiter, "session-1")
+        # Exhaust the burst
+        limiter._ws_buckets["session-1"].consume(limiter.config.ws_burst_limit)
 
-        # Second message rate limited
+        # Next message rate limited
         result = await check_ws_rate_limit(websocket, limiter, "session-1")
 
         assert result is False
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
+from agent_demos.core.exceptions import AudioProcessingError
 from agent_demos.demos.appointment_booking.services.voice_service import VoiceService
 from tests.conftest import MockSchedulingAgent, MockWebSTT, MockWebTTS
 
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+AUDIO_HELLO_WORLD = "SGVsbG8gV29ybGQ="  # "Hello World"
+
 
 class TestVoiceServiceInit:
     """Tests for VoiceService initialization."""
@@ -32,12 +38,12 @@ class TestVoiceServiceInit:
         """Test default voice setting."""
         # Test the class constant
         assert VoiceService.DEFAULT_VOICE == "nova"
+        assert VoiceService.DEFAULT_VOICE in VoiceService.AVAILABLE_VOICES
 
 
 class TestProcessVoice:
     """Tests for process_voice method."""
 
-    @pytest.mark.asyncio
     async def test_process_voice_success(
         self,
         voice_service: VoiceService,
@@ -51,7 +57,7 @@ class TestProcessVoice:
 
         transcribed, response, audio, changed = await voice_service.process_voice(
             session_id="test-session",
-            audio_base64="SGVsbG8gV29ybGQ=",
+            audio_base64=AUDIO_HELLO_WORLD,
             mime_type="audio/webm",
         )
 
@@ -60,7 +66,6 @@ class TestProcessVoice:
         assert audio == mock_tts._audio_base64
         assert changed is False
 
-    @pytest.mark.asyncio
     async def test_process_voice_empty_transcription(
         self,
         voice_service: VoiceService,
@@ -71,7 +76,7 @@ class TestProcessVoice:
 
         transcribed, response, audio, changed = await voice_service.process_voice(
             session_id="test-session",
-            audio_base64="SGVsbG8gV29ybGQ=",
+            audio_base64=AUDIO_HELLO_WORLD,
         )
 
         assert transcribed == ""
@@ -79,7 +84,6 @@ class TestProcessVoice:
         assert audio == ""
         assert changed is False
 
-    @pytest.mark.asyncio
     async def test_process_voice_whitespace_transcription(
         self,
         voice_service: VoiceService,
@@ -90,12 +94,11 @@ class TestProcessVoice:
 
         transcribed, response, audio, changed = await voice_service.process_voice(
             session_id="test-session",
-            audio_base64="SGVsbG8gV29ybGQ=",
+            audio_base64=AUDIO_HELLO_WORLD,
         )
 
         assert response == "I didn't catch that. Could you try again?"
 
-    @pytest.mark.asyncio
     async def test_process_voice_detects_booking(
         self,
         voice_service: VoiceService,
@@ -108,37 +111,38 @@ class TestProcessVoice:
 
         _, _, _, changed = await voice_service.process_voice(
             session_id="test-session",
-            audio_base64="SGVsbG8gV29ybGQ=",
+            audio_base64=AUDIO_HELLO_WORLD,
         )
 
         assert changed is True
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "mime_type",
+        ["audio/webm", "audio/wav", "audio/mp3", "audio/ogg"],
+    )
     async def test_process_voice_different_mime_types(
         self,
         voice_service: VoiceService,
         mock_stt: MockWebSTT,
         mock_scheduling_agent: MockSchedulingAgent,
+        mime_type: str,
     ) -> None:
         """Test processing with different MIME types."""
         mock_stt.set_transcription("Hello")
         mock_scheduling_agent.set_response("Hi there!")
 
-        mime_types = ["audio/webm", "audio/wav", "audio/mp3", "audio/ogg"]
-        for mime_type in mime_types:
-            transcribed, response, _, _ = await voice_service.process_voice(
-                session_id=f"session-{mime_type}",
-                audio_base64="SGVsbG8gV29ybGQ=",
-                mime_type=mime_type,
-            )
-            assert transcribed == "Hello"
-            assert response == "Hi there!"
+        transcribed, response, _, _ = await voice_service.process_voice(
+            session_id="test-session",
+            audio_base64=AUDIO_HELLO_WORLD,
+            mime_type=mime_type,
+        )
+        assert transcribed == "Hello"
+        assert response == "Hi there!"
 
 
 class TestTranscribeOnly:
     """Tests for transcribe_only method."""
 
-    @pytest.mark.asyncio
     async def test_transcribe_only(
         self,
         voice_service: VoiceService,
@@ -148,13 +152,12 @@ class TestTranscribeOnly:
         mock_stt.set_transcription("This is a test transcription.")
 
         result = await voice_service.transcribe_only(
-            audio_base64="SGVsbG8gV29ybGQ=",
+            audio_base64=AUDIO_HELLO_WORLD,
             mime_type="audio/webm",
         )
 
         assert result == "This is a test transcription."
 
-    @pytest.mark.asyncio
     async def test_transcribe_only_empty(
         self,
         voice_service: VoiceService,
@@ -164,7 +167,7 @@ class TestTranscribeOnly:
         mock_stt.set_transcription("")
 
         result = await voice_service.transcribe_only(
-            audio_base64="SGVsbG8gV29ybGQ=",
+            audio_base64=AUDIO_HELLO_WORLD,
         )
 
         assert result == ""
@@ -173,7 +176,6 @@ class TestTranscribeOnly:
 class TestSynthesizeOnly:
     """Tests for synthesize_only method."""
 
-    @pytest.mark.asyncio
     async def test_synthesize_only(
         self,
         voice_service: VoiceService,
@@ -189,7 +191,6 @@ class TestSynthesizeOnly:
         assert audio == "YXVkaW9fY29udGVudA=="
         assert mime_type == "audio/mpeg"
 
-    @pytest.mark.asyncio
     async def test_synthesize_only_with_voice(
         self,
         voice_service: VoiceService,
@@ -204,6 +205,17 @@ class TestSynthesizeOnly:
         assert audio is not None
         assert mime_type == "audio/mpeg"
 
+    async def test_synthesize_only_unknown_voice(
+        self,
+        voice_service: VoiceService,
+    ) -> None:
+        """Test that an unknown voice is rejected before reaching the TTS."""
+        with pytest.raises(AudioProcessingError, match="Unknown voice"):
+            await voice_service.synthesize_only(
+                text="Hello",
+                voice="robot",  # type: ignore
+            )
+
 
 class TestDetectAppointmentChanges:
     """Tests for _detect_appointment_changes method."""
@@ -243,11 +255,40 @@ class TestDetectAppointmentChanges:
         )
         assert result is True
 
+    def test_detect_first_person_phrase(self, voice_service: VoiceService) -> None:
+        """Test detection of first-person phrases like "I've booked"."""
+        result = voice_service._detect_appointment_changes(
+            "I've booked your dentist visit."
+        )
+        assert result is True
+
+    @pytest.mark.parametrize(
+        ("response", "expected"),
+        [
+            ("Your appointment has been booked successfully.", True),
+            (
+                "You have three open slots tomorrow afternoon, between 1pm and 5pm. "
+                "Would you like me to pick one of those for your dentist visit?",
+                False,
+            ),
+        ],
+        ids=["match", "no_match"],
+    )
+    def test_detect_benchmark(
+        self,
+        benchmark: BenchmarkFixture,
+        voice_service: VoiceService,
+        response: str,
+        expected: bool,
+    ) -> None:
+        """Benchmark detection; a non-matching response scans every indicator."""
+        result = benchmark(voice_service._detect_appointment_changes, response)
+        assert result is expected
+
 
 class TestProcessText:
     """Tests for _process_text method."""
 
-    @pytest.mark.asyncio
     async def test_process_text_new_session(
         self,
         voice_service: VoiceService,
@@ -265,27 +306,45 @@ class TestProcessText:
         assert changed is False
         assert "new-session" in voice_service._sessions
 
-    @pytest.mark.asyncio
     async def test_process_text_maintains_history(
         self,
         voice_service: VoiceService,
         mock_scheduling_agent: MockSchedulingAgent,
     ) -> None:
         """Test that history is maintained across calls."""
-        mock_scheduling_agent.set_response("First response")
+        mock_scheduling_agent.set_responses("First response", "Second response")
+
         await voice_service._process_text(
             session_id="test-session",
             message="First message",
         )
-
-        mock_scheduling_agent.set_response("Second response")
         await voice_service._process_text(
             session_id="test-session",
             message="Second message",
         )
 
-        history = voice_service._sessions.get("test-session", [])
-        assert len(history) > 0
+        assert voice_service._sessions["test-session"] == [
+            {"role": "user", "content": "First message"},
+            {"role": "assistant", "content": "First response"},
+            {"role": "user", "content": "Second message"},
+            {"role": "assistant", "content": "Second response"},
+        ]
+
+    async def test_process_text_evicts_least_recent_session(
+        self,
+        voice_service: VoiceService,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the least recently used session is dropped at the cap."""
+        monkeypatch.setattr(voice_service, "MAX_SESSIONS", 2)
+
+        await voice_service._process_text(session_id="session-1", message="Hi")
+        await voice_service._process_text(session_id="session-2", message="Hi")
+        # Using session-1 again makes session-2 the least recent
+        await voice_service._process_text(session_id="session-1", message="Hi")
+        await voice_service._process_text(session_id="session-3", message="Hi")
+
+        assert list(voice_service._sessions) == ["session-1", "session-3"]
 
 
 class TestGetHistory:
@@ -296,7 +355,6 @@ class TestGetHistory:
         history = voice_service.get_history("non-existent")
         assert history == []
 
-    @pytest.mark.asyncio
     async def test_get_history_with_messages(
         self,
         voice_service: VoiceService,
@@ -315,7 +373,6 @@ class TestGetHistory:
 class TestClearHistory:
     """Tests for clear_history method."""
 
-    @pytest.mark.asyncio
     async def test_clear_history(
         self,
         voice_service: VoiceService,
@@ -370,8 +427,7 @@ class TestFormatHistoryForClient:
 
         formatted = voice_service.format_history_for_client("test-session")
         assert len(formatted) == 1
-        assert "Part 1" in formatted[0]["content"]
-        assert "Part 2" in formatted[0]["content"]
+        assert formatted[0]["content"] == "Part 1 Part 2"
 
     def test_format_filters_empty_content(self, voice_service: VoiceService) -> None:
         """Test filtering of empty content."""
@@ -395,3 +451,7 @@ class TestAvailableVoices:
         assert len(voices) > 0
         assert "alloy" in voices
         assert "nova" in voices
+
+    def test_available_voices_match_validation(self, voice_service: VoiceService) -> None:
+        """Test that the advertised voices are exactly the ones accepted."""
+        assert set(voice_service.available_voices) == VoiceService.AVAILABLE_VOICES